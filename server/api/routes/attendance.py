@@ -728,7 +728,7 @@ async def get_group_persons(
             ]
 
         persons_with_face_data = []
-        all_persons = face_recognizer.get_all_persons()
+        all_persons = set(face_recognizer.get_all_persons())
 
         for member in members:
             has_face_data = member.person_id in all_persons
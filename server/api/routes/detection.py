@@ -1,8 +1,7 @@
+import asyncio
 import logging
 import time
 
-import cv2
-import numpy as np
 from fastapi import APIRouter, HTTPException, UploadFile, File
 
 from api.schemas import (
@@ -11,12 +10,9 @@ from api.schemas import (
     OptimizationRequest,
 )
 from config.models import FACE_DETECTOR_CONFIG
-from hooks import (
-    process_face_detection,
-    process_liveness_detection,
-)
+from hooks import process_frame, run_in_pipeline
 from utils import serialize_faces
-from utils.image_utils import decode_base64_image
+from utils.image_utils import decode_base64_image, decode_image_bytes
 
 if not logging.getLogger().handlers:
     logging.basicConfig(level=logging.INFO)
@@ -72,11 +68,11 @@ async def detect_faces(request: DetectionRequest):
     """
     Detect faces in a single image
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
 
-        image = decode_base64_image(request.image)
+        image = await asyncio.to_thread(decode_base64_image, request.image)
 
         if request.model_type == "face_detector":
             min_face_size = (
@@ -85,7 +81,8 @@ async def detect_faces(request: DetectionRequest):
                 else FACE_DETECTOR_CONFIG["min_face_size"]
             )
 
-            faces = process_face_detection(
+            faces = await run_in_pipeline(
+                process_frame,
                 image,
                 confidence_threshold=request.confidence_threshold,
                 nms_threshold=request.nms_threshold,
@@ -93,20 +90,12 @@ async def detect_faces(request: DetectionRequest):
                 enable_liveness=request.enable_liveness_detection,
             )
 
-            for face in faces:
-                if "track_id" not in face:
-                    face["track_id"] = -1
-
-            faces = process_liveness_detection(
-                faces, image, request.enable_liveness_detection
-            )
-
         else:
             raise HTTPException(
                 status_code=400, detail=f"Unsupported model type: {request.model_type}"
             )
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         serialized_faces = serialize_faces(faces, "/detect endpoint")
 
         processing_time_ms = processing_time * 1000
@@ -117,12 +106,16 @@ async def detect_faces(request: DetectionRequest):
         else:
             suggested_skip = 0
 
-        return DetectionResponse(
+        # model_construct skips validating the (possibly long) faces list, and
+        # FastAPI does not revalidate constructed instances when serializing,
+        # so scalar fields are coerced here; serialize_faces already emits
+        # plain Python types
+        return DetectionResponse.model_construct(
             success=True,
             faces=serialized_faces,
-            processing_time=processing_time,
-            model_used=request.model_type,
-            suggested_skip=suggested_skip,
+            processing_time=float(processing_time),
+            model_used=str(request.model_type),
+            suggested_skip=int(suggested_skip),
         )
 
     except Exception as e:
@@ -141,13 +134,12 @@ async def detect_faces_upload(
     """
     Detect faces in an uploaded image file
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         contents = await file.read()
 
-        nparr = np.frombuffer(contents, np.uint8)
-        image_bgr = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        image_bgr = await asyncio.to_thread(decode_image_bytes, contents)
 
         if image_bgr is None:
             raise HTTPException(status_code=400, detail="Invalid image file")
@@ -161,7 +153,8 @@ async def detect_faces_upload(
                 else FACE_DETECTOR_CONFIG["min_face_size"]
             )
 
-            faces = process_face_detection(
+            faces = await run_in_pipeline(
+                process_frame,
                 image,
                 confidence_threshold=confidence_threshold,
                 nms_threshold=nms_threshold,
@@ -169,18 +162,12 @@ async def detect_faces_upload(
                 enable_liveness=enable_liveness_detection,
             )
 
-            for face in faces:
-                if "track_id" not in face:
-                    face["track_id"] = -1
-
-            faces = process_liveness_detection(faces, image, enable_liveness_detection)
-
         else:
             raise HTTPException(
                 status_code=400, detail=f"Unsupported model type: {model_type}"
             )
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         serialized_faces = serialize_faces(faces, "/detect/upload endpoint")
 
         processing_time_ms = processing_time * 1000
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 
@@ -13,7 +14,7 @@ from api.schemas import (
     PersonUpdateRequest,
     SimilarityThresholdRequest,
 )
-from hooks import process_liveness_for_face_operation
+from hooks import process_liveness_for_face_operation, run_in_pipeline
 from utils.image_utils import decode_base64_image
 
 if not logging.getLogger().handlers:
@@ -31,7 +32,7 @@ async def recognize_face(
     """
     Recognize a face using face recognizer with liveness detection validation
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         from core.lifespan import face_recognizer
@@ -39,14 +40,18 @@ async def recognize_face(
         if not face_recognizer:
             raise HTTPException(status_code=500, detail="Face recognizer not available")
 
-        image = decode_base64_image(request.image)
+        image = await asyncio.to_thread(decode_base64_image, request.image)
 
         # Check liveness detection
-        should_block, error_msg = process_liveness_for_face_operation(
-            image, request.bbox, request.enable_liveness_detection, "Recognition"
+        should_block, error_msg = await run_in_pipeline(
+            process_liveness_for_face_operation,
+            image,
+            request.bbox,
+            request.enable_liveness_detection,
+            "Recognition",
         )
         if should_block:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             return FaceRecognitionResponse(
                 success=False,
                 person_id=None,
@@ -66,9 +71,11 @@ async def recognize_face(
         allowed_person_ids = None
         if request.group_id:
             allowed_person_ids = await repo.get_group_person_ids(request.group_id)
-        result = face_recognizer.recognize_face(image, landmarks_5, allowed_person_ids)
+        result = await run_in_pipeline(
+            face_recognizer.recognize_face, image, landmarks_5, allowed_person_ids
+        )
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         return FaceRecognitionResponse(
             success=result["success"],
@@ -79,7 +86,7 @@ async def recognize_face(
         )
 
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         logger.error(f"Face recognition error: {e}")
         return FaceRecognitionResponse(
             success=False,
@@ -95,7 +102,7 @@ async def register_person(request: FaceRegistrationRequest):
     """
     Register a new person in the face database with liveness detection validation
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         from core.lifespan import face_recognizer
@@ -103,14 +110,18 @@ async def register_person(request: FaceRegistrationRequest):
         if not face_recognizer:
             raise HTTPException(status_code=500, detail="Face recognizer not available")
 
-        image = decode_base64_image(request.image)
+        image = await asyncio.to_thread(decode_base64_image, request.image)
 
         # Check liveness detection
-        should_block, error_msg = process_liveness_for_face_operation(
-            image, request.bbox, request.enable_liveness_detection, "Registration"
+        should_block, error_msg = await run_in_pipeline(
+            process_liveness_for_face_operation,
+            image,
+            request.bbox,
+            request.enable_liveness_detection,
+            "Registration",
         )
         if should_block:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             return FaceRegistrationResponse(
                 success=False,
                 person_id=request.person_id,
@@ -127,9 +138,11 @@ async def register_person(request: FaceRegistrationRequest):
                 detail="Landmarks required for face recognition",
             )
 
-        result = face_recognizer.register_person(request.person_id, image, landmarks_5)
+        result = await run_in_pipeline(
+            face_recognizer.register_person, request.person_id, image, landmarks_5
+        )
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         return FaceRegistrationResponse(
             success=result["success"],
@@ -140,7 +153,7 @@ async def register_person(request: FaceRegistrationRequest):
         )
 
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         logger.error(f"Person registration error: {e}")
         return FaceRegistrationResponse(
             success=False,
@@ -1,19 +1,14 @@
+import asyncio
 import json
 import logging
 import time
 from datetime import datetime
 
-import cv2
-import numpy as np
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from config.models import FACE_DETECTOR_CONFIG
-from utils import serialize_faces
-from hooks import (
-    process_face_detection,
-    process_face_tracking,
-    process_liveness_detection,
-)
+from utils import serialize_faces, dumps_json, decode_image_bytes
+from hooks import process_frame, release_frame_cache, run_in_pipeline
 from utils.websocket_manager import manager, notification_manager
 
 if not logging.getLogger().handlers:
@@ -70,6 +65,8 @@ async def handle_websocket_detect(websocket: WebSocket, client_id: str):
         logger.info(f"[WebSocket] Created face tracker for client {client_id}")
 
     enable_liveness_detection = True
+    liveness_min_face_size = FACE_DETECTOR_CONFIG["min_face_size"]
+    connection_metadata = manager.connection_metadata
 
     try:
         await websocket.send_text(
@@ -134,15 +131,13 @@ async def handle_websocket_detect(websocket: WebSocket, client_id: str):
                         continue
 
                 elif "bytes" in message_data:
-                    if client_id in manager.connection_metadata:
-                        manager.connection_metadata[client_id][
-                            "last_activity"
-                        ] = datetime.now()
-                    start_time = time.time()
+                    metadata = connection_metadata.get(client_id)
+                    if metadata is not None:
+                        metadata["last_activity"] = datetime.now()
+                    start_time = time.perf_counter()
                     frame_bytes = message_data["bytes"]
 
-                    nparr = np.frombuffer(frame_bytes, np.uint8)
-                    image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+                    image = await asyncio.to_thread(decode_image_bytes, frame_bytes)
 
                     if image is None:
                         await websocket.send_text(
@@ -157,26 +152,22 @@ async def handle_websocket_detect(websocket: WebSocket, client_id: str):
                         continue
 
                     min_face_size = (
-                        0
-                        if not enable_liveness_detection
-                        else FACE_DETECTOR_CONFIG["min_face_size"]
+                        liveness_min_face_size if enable_liveness_detection else 0
                     )
 
-                    faces = process_face_detection(
+                    current_fps = manager.update_fps(client_id)
+                    faces = await run_in_pipeline(
+                        process_frame,
                         image,
                         min_face_size=min_face_size,
                         enable_liveness=enable_liveness_detection,
-                    )
-
-                    current_fps = manager.update_fps(client_id)
-                    faces = process_face_tracking(faces, image, current_fps, client_id)
-                    faces = process_liveness_detection(
-                        faces, image, enable_liveness_detection
+                        frame_rate=current_fps,
+                        client_id=client_id,
                     )
 
                     serialized_faces = serialize_faces(faces, "websocket")
 
-                    processing_time = time.time() - start_time
+                    processing_time = time.perf_counter() - start_time
 
                     current_timestamp = time.time()
                     response_data = {
@@ -190,16 +181,17 @@ async def handle_websocket_detect(websocket: WebSocket, client_id: str):
                     }
 
                     # Calculate suggested_skip based on processing time
-                    if processing_time * 1000 > 50:
+                    processing_ms = processing_time * 1000
+                    if processing_ms > 50:
                         suggested_skip = 2
-                    elif processing_time * 1000 > 30:
+                    elif processing_ms > 30:
                         suggested_skip = 1
                     else:
                         suggested_skip = 0
 
                     response_data["suggested_skip"] = suggested_skip
 
-                    await websocket.send_text(json.dumps(response_data))
+                    await websocket.send_text(dumps_json(response_data))
 
             except WebSocketDisconnect:
                 # Connection closed by client, exit gracefully
@@ -255,6 +247,8 @@ async def handle_websocket_detect(websocket: WebSocket, client_id: str):
     finally:
         if manager.active_connections.get(client_id) is websocket:
             await manager.disconnect(client_id)
+            # Serialized with detection so an in-flight frame can't re-add it
+            await run_in_pipeline(release_frame_cache, client_id)
         logger.info(f"[WebSocket] Detection endpoint closed for client {client_id}")
 
 
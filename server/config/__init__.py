@@ -11,10 +11,15 @@ from .models import (
     FACE_RECOGNIZER_CONFIG,
     FACE_TRACKER_MODEL_PATH,
     FACE_TRACKER_CONFIG,
+    OPENCV_NUM_THREADS,
     validate_model_paths,
     validate_directories,
 )
-from .logging_config import LOGGING_CONFIG, get_logging_config
+from .logging_config import (
+    LOGGING_CONFIG,
+    get_logging_config,
+    get_multiprocess_logging_config,
+)
 
 __all__ = [
     "BASE_DIR",
@@ -34,8 +39,10 @@ __all__ = [
     "FACE_RECOGNIZER_CONFIG",
     "FACE_TRACKER_MODEL_PATH",
     "FACE_TRACKER_CONFIG",
+    "OPENCV_NUM_THREADS",
     "validate_model_paths",
     "validate_directories",
     "LOGGING_CONFIG",
     "get_logging_config",
+    "get_multiprocess_logging_config",
 ]
@@ -1,4 +1,39 @@
+import copy
+import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
+
+
+# Records are formatted on the logging thread and queued; a listener thread
+# does the file writes and rollover so request/inference threads never block
+class QueuedRotatingFileHandler(logging.handlers.QueueHandler):
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None):
+        super().__init__(queue.SimpleQueue())
+        self.file_handler = logging.handlers.RotatingFileHandler(
+            filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding
+        )
+        self.listener = logging.handlers.QueueListener(self.queue, self.file_handler)
+        self.listener.start()
+        self._listening = True
+
+    def close(self):
+        if self._listening:
+            self._listening = False
+            self.listener.stop()
+            self.file_handler.close()
+        super().close()
+
+
+# uvicorn applies its log_config in the supervising process and again in every
+# worker/reload subprocess; only the parent may own (and rotate) server.log, so
+# subprocesses get a no-op handler and log to the console only
+def _parent_file_handler(**kwargs):
+    if multiprocessing.parent_process() is not None:
+        return logging.NullHandler()
+    return QueuedRotatingFileHandler(**kwargs)
+
 
 LOGGING_CONFIG = {
     "version": 1,
@@ -16,7 +51,7 @@ LOGGING_CONFIG = {
             "stream": "ext://sys.stdout",
         },
         "file": {
-            "class": "logging.handlers.RotatingFileHandler",
+            "()": QueuedRotatingFileHandler,
             "level": "INFO",
             "formatter": "default",
             "filename": "server.log",
@@ -66,3 +101,10 @@ def get_logging_config():
         config["handlers"]["console"]["level"] = "WARNING"
 
     return config
+
+
+def get_multiprocess_logging_config(logging_config):
+    """Copy of a logging config that is safe to hand to uvicorn workers"""
+    config = copy.deepcopy(logging_config)
+    config["handlers"]["file"]["()"] = _parent_file_handler
+    return config
@@ -1,6 +1,13 @@
+import os
+
 from .paths import WEIGHTS_DIR, DATA_DIR
 from .onnx import OPTIMIZED_PROVIDERS, OPTIMIZED_SESSION_OPTIONS
 
+# OpenCV's pool (YuNet, resizes, warps) defaults to every core and competes
+# with the frame-decode threads and liveness preprocess workers; YuNet gains
+# little past a few threads at camera resolutions
+OPENCV_NUM_THREADS = min(4, os.cpu_count() or 1)
+
 MODEL_CONFIGS = {
     "face_detector": {
         "model_path": WEIGHTS_DIR / "detector.onnx",
@@ -10,6 +17,12 @@ MODEL_CONFIGS = {
         "top_k": 5000,
         "min_face_size": 60,
         "edge_margin": 5,
+        # Reuse detections while a frame's 32x32 gray thumbnail differs from
+        # the last detected frame by less than this mean abs value (0 = off)
+        "frame_cache_threshold": 0.0,
+        # Detect on a copy downscaled so its longer side is at most this many
+        # pixels; coordinates are mapped back to the frame (0 = off)
+        "detection_max_side": 0,
     },
     "liveness_detector": {
         "model_path": WEIGHTS_DIR / "liveness.onnx",
@@ -18,6 +31,14 @@ MODEL_CONFIGS = {
         "model_img_size": 128,
         "temporal_alpha": 0.5,
         "enable_temporal_smoothing": True,
+        "upscale_interpolation": "linear",  # linear | cubic | lanczos4
+        "warmup_batch_sizes": (1, 4, 8),
+        # Stable live tracks reuse their verdict for up to this many frames
+        # (<= 1 = off); stability needs stable_frames confident results.
+        # Saves anti-spoof inference, but a spoof swapped in on a stable
+        # track can pass for up to period - 1 frames
+        "stable_frames": 10,
+        "stable_recheck_period": 0,
     },
     "face_recognizer": {
         "model_path": WEIGHTS_DIR / "recognizer.onnx",
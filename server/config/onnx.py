@@ -1,8 +1,13 @@
+from .paths import DATA_DIR
+
+TRT_ENGINE_CACHE_DIR = DATA_DIR / "trt_cache"
+
 try:
     import onnxruntime as ort
 
     available = ort.get_available_providers()
     providers = []
+    trt_provider = None
     gpu_name = "CPU Only"
 
     if "CUDAExecutionProvider" in available:
@@ -13,13 +18,28 @@ try:
                     "device_id": 0,
                     "arena_extend_strategy": "kNextPowerOfTwo",
                     "gpu_mem_limit": 2 * 1024 * 1024 * 1024,
+                    "cudnn_conv_algo_search": "EXHAUSTIVE",
+                    "cudnn_conv_use_max_workspace": "1",
+                    "do_copy_in_default_stream": "1",
                 },
             )
         )
         gpu_name = "NVIDIA GPU (CUDA)"
         if "TensorrtExecutionProvider" in available:
-            providers.append(("TensorrtExecutionProvider", {"device_id": 0}))
-            gpu_name = "NVIDIA GPU (CUDA + TensorRT)"
+            # FP16 TensorRT is for the liveness model only (LIVENESS_PROVIDERS):
+            # recognizer embeddings must stay numerically identical to the
+            # templates already stored in the database
+            trt_provider = (
+                "TensorrtExecutionProvider",
+                {
+                    "device_id": 0,
+                    "trt_fp16_enable": True,
+                    "trt_engine_cache_enable": True,
+                    "trt_engine_cache_path": str(TRT_ENGINE_CACHE_DIR),
+                    "trt_max_workspace_size": 1 << 30,
+                },
+            )
+            gpu_name = "NVIDIA GPU (CUDA, TensorRT for liveness)"
     elif "DmlExecutionProvider" in available:
         providers.append(("DmlExecutionProvider", {"device_id": 0}))
         gpu_name = "Intel/AMD iGPU (DirectML)"
@@ -36,6 +56,10 @@ try:
     )
 
     OPTIMIZED_PROVIDERS = providers
+    # TensorRT goes first so it claims the graph; CUDA stays as the fallback
+    # for unsupported nodes or a failed engine build
+    LIVENESS_PROVIDERS = [trt_provider, *providers] if trt_provider else providers
+    GPU_ACCELERATED = providers[0][0] != "CPUExecutionProvider"
     print(f"GPU Auto-Detection: {gpu_name}")
 
 except Exception as e:
@@ -52,6 +76,12 @@ except Exception as e:
             },
         ),
     ]
+    LIVENESS_PROVIDERS = OPTIMIZED_PROVIDERS
+    GPU_ACCELERATED = False
+
+# With a GPU provider the CPU thread pools only run glue ops; a full-size
+# pool per session just spins against the event loop and the other sessions
+_SESSION_THREADS = 1 if GPU_ACCELERATED else 0
 
 try:
     import onnxruntime as ort
@@ -62,8 +92,8 @@ try:
         "enable_profiling": False,
         "execution_mode": ort.ExecutionMode.ORT_SEQUENTIAL,
         "graph_optimization_level": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
-        "inter_op_num_threads": 0,
-        "intra_op_num_threads": 0,
+        "inter_op_num_threads": _SESSION_THREADS,
+        "intra_op_num_threads": _SESSION_THREADS,
         "log_severity_level": 3,
     }
 except ImportError:
@@ -71,7 +101,7 @@ except ImportError:
         "enable_cpu_mem_arena": True,
         "enable_memory_pattern": True,
         "enable_profiling": False,
-        "inter_op_num_threads": 0,
-        "intra_op_num_threads": 0,
+        "inter_op_num_threads": _SESSION_THREADS,
+        "intra_op_num_threads": _SESSION_THREADS,
         "log_severity_level": 3,
     }
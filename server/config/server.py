@@ -1,12 +1,29 @@
+import importlib.util
 import os
+import sys
 from typing import Dict, Any
 
+
+def _module_available(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+# Select the uvicorn[standard] loop/parser explicitly (and log the choice)
+# rather than relying on "auto"; uvloop is POSIX-only
+EVENT_LOOP = (
+    "uvloop" if sys.platform != "win32" and _module_available("uvloop") else "asyncio"
+)
+HTTP_PROTOCOL = "httptools" if _module_available("httptools") else "h11"
+
 SERVER_CONFIG = {
     "host": "127.0.0.1",
     "port": 8700,
     "reload": False,
     "log_level": "info",
     "workers": 1,
+    "access_log": True,
+    "loop": EVENT_LOOP,
+    "http": HTTP_PROTOCOL,
 }
 
 
@@ -16,7 +33,7 @@ def get_server_config() -> Dict[str, Any]:
 
     if env == "production":
         config["reload"] = False
-        config["workers"] = 4
+        config["access_log"] = False
     elif env == "testing":
         config["port"] = 8700
 
@@ -24,5 +41,10 @@ def get_server_config() -> Dict[str, Any]:
         config["host"] = os.getenv("SERVER_HOST")
     if os.getenv("SERVER_PORT"):
         config["port"] = int(os.getenv("SERVER_PORT"))
+    # Opt-in only: every worker loads its own model sessions (GPU memory per
+    # process), and websocket broadcasts/notifications only reach clients
+    # connected to the same worker
+    if os.getenv("SERVER_WORKERS"):
+        config["workers"] = max(1, int(os.getenv("SERVER_WORKERS")))
 
     return config
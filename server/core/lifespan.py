@@ -1,6 +1,7 @@
 import logging
 from contextlib import asynccontextmanager
 
+import cv2
 from fastapi import FastAPI
 
 from config.models import (
@@ -9,6 +10,7 @@ from config.models import (
     FACE_RECOGNIZER_CONFIG,
     FACE_RECOGNIZER_MODEL_PATH,
     LIVENESS_DETECTOR_CONFIG,
+    OPENCV_NUM_THREADS,
 )
 from core.models import (
     LivenessDetector,
@@ -35,6 +37,9 @@ async def lifespan(app: FastAPI):
     try:
         logger.info("Starting up backend server...")
 
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(OPENCV_NUM_THREADS)
+
         face_detector = FaceDetector(
             model_path=str(FACE_DETECTOR_MODEL_PATH),
             input_size=FACE_DETECTOR_CONFIG["input_size"],
@@ -43,6 +48,8 @@ async def lifespan(app: FastAPI):
             top_k=FACE_DETECTOR_CONFIG["top_k"],
             min_face_size=FACE_DETECTOR_CONFIG["min_face_size"],
             edge_margin=FACE_DETECTOR_CONFIG["edge_margin"],
+            frame_cache_threshold=FACE_DETECTOR_CONFIG["frame_cache_threshold"],
+            detection_max_side=FACE_DETECTOR_CONFIG["detection_max_side"],
         )
 
         liveness_detector = LivenessDetector(
@@ -56,6 +63,10 @@ async def lifespan(app: FastAPI):
             enable_temporal_smoothing=LIVENESS_DETECTOR_CONFIG[
                 "enable_temporal_smoothing"
             ],
+            upscale_interpolation=LIVENESS_DETECTOR_CONFIG["upscale_interpolation"],
+            warmup_batch_sizes=LIVENESS_DETECTOR_CONFIG["warmup_batch_sizes"],
+            stable_frames=LIVENESS_DETECTOR_CONFIG["stable_frames"],
+            stable_recheck_period=LIVENESS_DETECTOR_CONFIG["stable_recheck_period"],
         )
 
         face_recognizer = FaceRecognizer(
@@ -84,4 +95,9 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down...")
+
+    # Close the face database's per-thread connections, checkpointing its WAL
+    if face_recognizer is not None and face_recognizer.db_manager:
+        face_recognizer.db_manager.close()
+
     logger.info("Shutdown complete")
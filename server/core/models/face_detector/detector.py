@@ -1,8 +1,9 @@
+import cv2 as cv
 import numpy as np
 import logging as log
-from typing import List
+from typing import Dict, Hashable, List, Optional
 from .session_utils import init_face_detector_session
-from .postprocess import process_detection
+from .postprocess import process_detections
 
 logger = log.getLogger(__name__)
 
@@ -17,11 +18,18 @@ class FaceDetector:
         top_k: int,
         min_face_size: int,
         edge_margin: int = 0,
+        frame_cache_threshold: float = 0.0,
+        detection_max_side: int = 0,
     ):
         self.detector = None
-        self.set_score_threshold(conf_threshold)
-        self.set_nms_threshold(nms_threshold)
-        self.set_top_k(top_k)
+        self._input_size = None
+        self.frame_cache_threshold = frame_cache_threshold
+        self.detection_max_side = detection_max_side
+        # cache_key -> (frame shape, 32x32 gray thumbnail, raw YuNet output)
+        self._frame_cache: Dict[Hashable, tuple] = {}
+        self.conf_threshold = conf_threshold
+        self.nms_threshold = nms_threshold
+        self.top_k = top_k
         self.set_min_face_size(min_face_size)
         self.set_edge_margin(edge_margin)
 
@@ -32,9 +40,13 @@ class FaceDetector:
             nms_threshold,
             top_k,
         )
+        self._input_size = tuple(input_size)
 
     def detect_faces(
-        self, image: np.ndarray, enable_liveness: bool = False
+        self,
+        image: np.ndarray,
+        enable_liveness: bool = False,
+        cache_key: Optional[Hashable] = None,
     ) -> List[dict]:
         if not self.detector or image is None or image.size == 0:
             logger.warning("Invalid image provided to face detector")
@@ -42,43 +54,101 @@ class FaceDetector:
 
         orig_height, orig_width = image.shape[:2]
 
-        self.detector.setInputSize((orig_width, orig_height))
-        faces = self.detector.detect(image)[1]
+        # Optionally detect on a downscaled copy; YuNet's cost grows with
+        # input area, and boxes/landmarks are mapped back below
+        scale = 1.0
+        detect_image = image
+        if 0 < self.detection_max_side < max(orig_width, orig_height):
+            scale = self.detection_max_side / max(orig_width, orig_height)
+            detect_image = cv.resize(
+                image,
+                (round(orig_width * scale), round(orig_height * scale)),
+                interpolation=cv.INTER_AREA,
+            )
+
+        # setInputSize regenerates YuNet's prior boxes; only redo it when
+        # the frame size actually changes
+        detect_height, detect_width = detect_image.shape[:2]
+        if self._input_size != (detect_width, detect_height):
+            self._input_size = (detect_width, detect_height)
+            self.detector.setInputSize(self._input_size)
+        faces = self._detect(detect_image, cache_key)
 
         if faces is None or len(faces) == 0:
             return []
 
+        if scale != 1.0:
+            # Columns 0-13 are bbox and landmark coordinates, 14 is the score.
+            # Copy first: the raw output may be held by the frame cache
+            faces = faces.copy()
+            faces[:, :14] *= np.float32(1.0 / scale)
+
         margin = self.edge_margin if enable_liveness else 0
         min_size = self.min_face_size if enable_liveness else 0
 
-        detections = []
-        for face in faces:
-            landmarks_5 = face[4:14].reshape(5, 2)
-            detection = process_detection(
-                face,
-                min_size,
-                landmarks_5,
-                orig_width,
-                orig_height,
-                margin,
-            )
-            if detection is not None:
-                detections.append(detection)
+        return process_detections(
+            faces,
+            min_size,
+            orig_width,
+            orig_height,
+            margin,
+        )
+
+    def _detect(self, image: np.ndarray, cache_key: Optional[Hashable] = None):
+        # Only a keyed stream (one websocket client) may reuse results;
+        # stateless callers always run the detector
+        if self.frame_cache_threshold <= 0 or cache_key is None:
+            return self.detector.detect(image)[1]
+
+        # Reuse the raw YuNet output when the frame has the same shape and is
+        # practically unchanged, judged by mean abs difference of a 32x32
+        # grayscale thumbnail
+        thumb = cv.resize(
+            cv.cvtColor(image, cv.COLOR_BGR2GRAY), (32, 32), interpolation=cv.INTER_AREA
+        )
+        cached = self._frame_cache.get(cache_key)
+        if cached is not None:
+            prev_shape, prev_thumb, prev_faces = cached
+            if (
+                prev_shape == image.shape
+                and cv.norm(thumb, prev_thumb, cv.NORM_L1) / thumb.size
+                < self.frame_cache_threshold
+            ):
+                return prev_faces
+
+        faces = self.detector.detect(image)[1]
+        self._frame_cache[cache_key] = (image.shape, thumb, faces)
+        return faces
 
-        return detections
+    def clear_frame_cache(self, cache_key: Optional[Hashable] = None):
+        if cache_key is None:
+            self._frame_cache.clear()
+        else:
+            self._frame_cache.pop(cache_key, None)
 
+    # Per-request setters (HTTP /detect) only clear every client's frame cache
+    # when a value actually changes
     def set_score_threshold(self, threshold):
+        if threshold == self.conf_threshold:
+            return
         self.conf_threshold = threshold
+        self.clear_frame_cache()
         if self.detector:
             self.detector.setScoreThreshold(threshold)
 
     def set_nms_threshold(self, threshold):
+        if threshold == self.nms_threshold:
+            return
         self.nms_threshold = threshold
+        self.clear_frame_cache()
         if self.detector:
             self.detector.setNMSThreshold(threshold)
 
     def set_top_k(self, top_k):
+        if top_k == self.top_k:
+            return
         self.top_k = top_k
+        self.clear_frame_cache()
         if self.detector:
             self.detector.setTopK(top_k)
 
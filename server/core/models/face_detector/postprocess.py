@@ -1,44 +1,60 @@
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List
 
 
-def process_detection(
-    face: np.ndarray,
+def process_detections(
+    faces: np.ndarray,
     min_face_size: int,
-    landmarks_5: np.ndarray,
     img_width: int,
     img_height: int,
     edge_margin: int = 0,
-) -> Optional[Dict]:
-    x, y, w, h = face[:4].astype(int)
-    conf = float(face[14])
+) -> List[Dict]:
+    boxes = faces[:, :4].astype(np.int32)
+    x, y, w, h = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
 
-    if x < 0 or y < 0 or x + w > img_width or y + h > img_height:
-        return None
+    dist_left = x
+    dist_right = img_width - (x + w)
+    dist_top = y
+    dist_bottom = img_height - (y + h)
+
+    keep = (dist_left >= 0) & (dist_top >= 0) & (dist_right >= 0) & (dist_bottom >= 0)
 
     if edge_margin > 0:
-        dist_left = x
-        dist_right = img_width - (x + w)
-        dist_top = y
-        dist_bottom = img_height - (y + h)
-        if min(dist_left, dist_right, dist_top, dist_bottom) < edge_margin:
-            return None
-
-    detection = {
-        "bbox": {
-            "x": float(x),
-            "y": float(y),
-            "width": float(w),
-            "height": float(h),
-        },
-        "confidence": conf,
-        "landmarks_5": landmarks_5.tolist(),
-    }
-
-    if min_face_size > 0 and (w < min_face_size or h < min_face_size):
-        detection["liveness"] = {
-            "is_real": None,
-            "status": "move_closer",
+        min_dist = np.minimum(
+            np.minimum(dist_left, dist_right), np.minimum(dist_top, dist_bottom)
+        )
+        keep &= min_dist >= edge_margin
+
+    if not keep.any():
+        return []
+
+    if min_face_size > 0:
+        too_small = ((w < min_face_size) | (h < min_face_size))[keep].tolist()
+    else:
+        too_small = [False] * int(keep.sum())
+
+    kept_faces = faces[keep]
+    # Integer pixel boxes, emitted as floats in one conversion
+    boxes_list = boxes[keep].astype(np.float64).tolist()
+    confidences = kept_faces[:, 14].tolist()
+    landmarks = kept_faces[:, 4:14].reshape(-1, 5, 2).tolist()
+
+    detections = []
+    for (bx, by, bw, bh), conf, landmarks_5, small in zip(
+        boxes_list, confidences, landmarks, too_small
+    ):
+        detection = {
+            "bbox": {"x": bx, "y": by, "width": bw, "height": bh},
+            "confidence": conf,
+            "landmarks_5": landmarks_5,
         }
 
-    return detection
+        if small:
+            detection["liveness"] = {
+                "is_real": None,
+                "status": "move_closer",
+            }
+
+        detections.append(detection)
+
+    return detections
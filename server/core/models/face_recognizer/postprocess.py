@@ -80,3 +80,81 @@ def find_best_match(
         return best_person_id, best_similarity
     else:
         return None, best_similarity
+
+
+def stack_embeddings(
+    database: Dict[str, np.ndarray], embedding_dim: int
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Stack database embeddings into a contiguous matrix for batched matching.
+
+    Args:
+        database: Dictionary mapping person_id to embedding
+        embedding_dim: Embedding dimension, used for the empty-database shape
+
+    Returns:
+        Tuple of (person_ids, embeddings)
+        - person_ids: Person IDs in row order
+        - embeddings: Matrix [N, embedding_dim] (float32)
+    """
+    person_ids = list(database.keys())
+    if not person_ids:
+        return person_ids, np.empty((0, embedding_dim), dtype=np.float32)
+
+    embeddings = np.stack(list(database.values())).astype(np.float32, copy=False)
+    return person_ids, embeddings
+
+
+def find_best_match_stacked(
+    query_embedding: np.ndarray,
+    person_ids: List[str],
+    embeddings: np.ndarray,
+    similarity_threshold: float,
+    allowed_person_ids: Optional[List[str]] = None,
+) -> Tuple[Optional[str], float]:
+    """
+    Find best matching person with a single matrix-vector product.
+
+    Same semantics as find_best_match, over the output of stack_embeddings.
+
+    Args:
+        query_embedding: Query embedding (normalized)
+        person_ids: Person IDs in row order
+        embeddings: Stacked database embeddings [N, embedding_dim]
+        similarity_threshold: Minimum similarity threshold for recognition
+        allowed_person_ids: Optional list of allowed person IDs for filtering
+
+    Returns:
+        Tuple of (best_person_id, best_similarity)
+        - best_person_id: Person ID if match found above threshold, else None
+        - best_similarity: Best similarity score found
+    """
+    if not person_ids:
+        return None, 0.0
+
+    similarities = embeddings @ query_embedding.astype(np.float32, copy=False)
+
+    # Filter by allowed person IDs if provided
+    if allowed_person_ids is not None:
+        allowed = set(allowed_person_ids)
+        mask = np.fromiter(
+            (pid in allowed for pid in person_ids),
+            dtype=bool,
+            count=len(person_ids),
+        )
+        if not mask.any():
+            return None, 0.0
+        similarities = np.where(mask, similarities, -np.inf)
+
+    best_index = int(np.argmax(similarities))
+    best_similarity = float(similarities[best_index])
+
+    # Only positive similarities count as a candidate
+    if best_similarity <= 0.0:
+        return None, 0.0
+
+    # Only return person_id if similarity meets threshold
+    if best_similarity >= similarity_threshold:
+        return person_ids[best_index], best_similarity
+    else:
+        return None, best_similarity
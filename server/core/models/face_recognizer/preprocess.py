@@ -1,5 +1,6 @@
 import cv2
 import numpy as np
+from functools import lru_cache
 from typing import List, Tuple
 
 
@@ -53,6 +54,23 @@ def align_face(
     return aligned_face
 
 
+@lru_cache(maxsize=4)
+def _normalization_lut(input_mean: float, input_std: float) -> np.ndarray:
+    """
+    Build a uint8 -> float32 lookup table for (x - mean) / std.
+
+    Args:
+        input_mean: Mean value for normalization
+        input_std: Standard deviation for normalization
+
+    Returns:
+        Read-only float32 array of 256 normalized values
+    """
+    lut = (np.arange(256, dtype=np.float32) - input_mean) / input_std
+    lut.setflags(write=False)
+    return lut
+
+
 def preprocess_image(
     aligned_face: np.ndarray, input_mean: float = 127.5, input_std: float = 127.5
 ) -> np.ndarray:
@@ -67,8 +85,9 @@ def preprocess_image(
     Returns:
         Preprocessed tensor with shape [C, H, W] (no batch dimension)
     """
-    rgb_image = cv2.cvtColor(aligned_face, cv2.COLOR_BGR2RGB)
-    normalized = (rgb_image.astype(np.float32) - input_mean) / input_std
+    # BGR->RGB swap and normalization fused into a single table lookup
+    lut = _normalization_lut(float(input_mean), float(input_std))
+    normalized = lut[aligned_face[..., ::-1]]
     input_tensor = np.transpose(normalized, (2, 0, 1))
     return input_tensor
 
@@ -125,7 +144,12 @@ def preprocess_batch(
     if not aligned_faces:
         return np.array([])
 
-    batch_tensors = [
-        preprocess_image(face, input_mean, input_std) for face in aligned_faces
-    ]
-    return np.stack(batch_tensors, axis=0)
+    # Gather each face through the LUT straight into its slot of a single
+    # NCHW batch, skipping per-face HWC intermediates and the final stack
+    lut = _normalization_lut(float(input_mean), float(input_std))
+    height, width = aligned_faces[0].shape[:2]
+    batch = np.empty((len(aligned_faces), 3, height, width), dtype=np.float32)
+    for face, slot in zip(aligned_faces, batch):
+        np.take(lut, face[..., ::-1].transpose(2, 0, 1), out=slot)
+
+    return batch
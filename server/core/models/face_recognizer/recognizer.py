@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import List, Dict, Tuple, Optional, Any
 
 import numpy as np
@@ -12,7 +11,8 @@ from .preprocess import (
 )
 from .postprocess import (
     normalize_embeddings_batch,
-    find_best_match,
+    stack_embeddings,
+    find_best_match_stacked,
 )
 
 logger = logging.getLogger(__name__)
@@ -56,10 +56,14 @@ class FaceRecognizer:
             self.db_manager = None
             logger.warning("No database path provided, running without persistence")
 
-        # Cache Layer: Person database cache
+        # Cache Layer: Person database cache, reloaded only when the
+        # database files change on disk
         self._persons_cache = None
-        self._cache_timestamp = 0
-        self._cache_ttl = 1.0
+        self._cache_signature = None
+
+        # Stacked [N, D] view of the cached database, rebuilt when it changes
+        self._stacked_source = None
+        self._stacked_embeddings = ([], np.empty((0, self.EMBEDDING_DIM), np.float32))
 
     def _extract_embeddings(
         self, image: np.ndarray, face_data_list: List[Dict]
@@ -97,20 +101,35 @@ class FaceRecognizer:
         Returns:
             Dictionary mapping person_id to embedding
         """
-        current_time = time.time()
-
-        if (
-            self._persons_cache is None
-            or (current_time - self._cache_timestamp) > self._cache_ttl
-        ):
-            if self.db_manager:
-                self._persons_cache = self.db_manager.get_all_persons()
-            else:
+        if not self.db_manager:
+            if self._persons_cache is None:
                 self._persons_cache = {}
-            self._cache_timestamp = current_time
+            return self._persons_cache
+
+        # Signature is taken before reading, so a write racing the load
+        # leaves it stale and triggers another reload on the next call
+        signature = self.db_manager.get_file_signature()
+        if self._persons_cache is None or signature != self._cache_signature:
+            self._persons_cache = self.db_manager.get_all_persons()
+            self._cache_signature = signature
 
         return self._persons_cache
 
+    def _get_stacked_embeddings(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Get the cached database as stacked embeddings for batched matching.
+
+        Returns:
+            Tuple of (person_ids, embeddings matrix [N, embedding_dim])
+        """
+        database = self._get_database()
+
+        if database is not self._stacked_source:
+            self._stacked_embeddings = stack_embeddings(database, self.EMBEDDING_DIM)
+            self._stacked_source = database
+
+        return self._stacked_embeddings
+
     def _find_best_match(
         self, embedding: np.ndarray, allowed_person_ids: Optional[List[str]] = None
     ) -> Tuple[Optional[str], float]:
@@ -122,24 +141,28 @@ class FaceRecognizer:
         if not self.db_manager:
             return None, 0.0
 
-        database = self._get_database()
+        person_ids, embeddings = self._get_stacked_embeddings()
 
-        if not database:
+        if not person_ids:
             return None, 0.0
 
         # Postprocessing Layer: Find best match
-        return find_best_match(
-            embedding, database, self.similarity_threshold, allowed_person_ids
+        return find_best_match_stacked(
+            embedding,
+            person_ids,
+            embeddings,
+            self.similarity_threshold,
+            allowed_person_ids,
         )
 
     def _refresh_cache(self):
         """Refresh cache after database modifications"""
         if self.db_manager:
+            self._cache_signature = self.db_manager.get_file_signature()
             self._persons_cache = self.db_manager.get_all_persons()
-            self._cache_timestamp = time.time()
         else:
             self._persons_cache = None
-            self._cache_timestamp = 0
+            self._cache_signature = None
 
     def recognize_face(
         self,
@@ -216,6 +239,77 @@ class FaceRecognizer:
             logger.error(f"Person registration failed: {e}")
             return {"success": False, "error": str(e), "person_id": person_id}
 
+    def register_persons_batch(
+        self, entries: List[Tuple[str, np.ndarray, List]]
+    ) -> List[Dict]:
+        """
+        Register several persons with a single database write and cache refresh.
+
+        Embeddings are still extracted one face per run: the model is
+        dynamically quantized, so batching would shift templates away from
+        the single-face embeddings produced by recognize_face.
+
+        Args:
+            entries: List of (person_id, image, landmarks_5) tuples
+
+        Returns:
+            List of per-entry registration results, in input order
+        """
+        results: List[Dict] = []
+        extracted = []
+
+        for person_id, image, landmarks_5 in entries:
+            try:
+                embeddings = self._extract_embeddings(
+                    image, [{"landmarks_5": landmarks_5}]
+                )
+            except Exception as e:
+                logger.error(f"Person registration failed: {e}")
+                results.append(
+                    {"success": False, "error": str(e), "person_id": person_id}
+                )
+                continue
+
+            if not embeddings:
+                results.append(
+                    {
+                        "success": False,
+                        "error": "Failed to extract embedding",
+                        "person_id": person_id,
+                    }
+                )
+                continue
+
+            extracted.append((person_id, embeddings[0]))
+            results.append({"success": True, "person_id": person_id})
+
+        if not extracted:
+            return results
+
+        try:
+            if self.db_manager:
+                save_success = self.db_manager.add_persons(extracted)
+                stats = self.db_manager.get_stats()
+                total_persons = stats.get("total_persons", 0)
+                self._refresh_cache()
+            else:
+                save_success = False
+                total_persons = 0
+                logger.warning("No database manager available for registration")
+        except Exception as e:
+            logger.error(f"Batch person registration failed: {e}")
+            for result in results:
+                if result["success"]:
+                    result.update(success=False, error=str(e))
+            return results
+
+        for result in results:
+            if result["success"]:
+                result["database_saved"] = save_success
+                result["total_persons"] = total_persons
+
+        return results
+
     def remove_person(self, person_id: str) -> Dict:
         """Remove a person from the database"""
         try:
@@ -253,8 +347,7 @@ class FaceRecognizer:
     def get_all_persons(self) -> List[str]:
         """Get list of all registered person IDs"""
         if self.db_manager:
-            all_persons = self.db_manager.get_all_persons()
-            return list(all_persons.keys())
+            return self.db_manager.list_persons()
         return []
 
     def update_person_id(self, old_person_id: str, new_person_id: str) -> Dict:
@@ -325,4 +418,4 @@ class FaceRecognizer:
     def _invalidate_cache(self):
         """Invalidate cache without refreshing"""
         self._persons_cache = None
-        self._cache_timestamp = 0
+        self._cache_signature = None
@@ -1,22 +1,24 @@
-import cv2
+import math
 import numpy as np
-from typing import List, Dict, Optional
-from .session_utils import init_onnx_session
+from typing import List, Dict, Optional, Sequence
+from .session_utils import init_onnx_session, get_input_dtype, SessionBinding
 from .preprocess import (
+    UPSCALE_INTERPOLATIONS,
+    bboxes_to_array,
     crop,
     extract_face_crops_from_detections,
 )
 from .postprocess import (
-    validate_detection,
     run_batch_inference,
     assemble_liveness_results,
 )
 from .temporal_smoothing import TemporalSmoother
+from .stable_cache import StableLivenessCache
 
 
 def probability_to_logit_threshold(p: float) -> float:
     p = max(1e-6, min(1 - 1e-6, p))
-    return np.log(p / (1 - p))
+    return math.log(p / (1 - p))
 
 
 class LivenessDetector:
@@ -28,13 +30,29 @@ class LivenessDetector:
         bbox_inc: float,
         temporal_alpha: Optional[float] = None,
         enable_temporal_smoothing: bool = True,
+        upscale_interpolation: str = "linear",
+        warmup_batch_sizes: Sequence[int] = (),
+        stable_frames: int = 10,
+        stable_recheck_period: int = 0,
     ):
+        if upscale_interpolation not in UPSCALE_INTERPOLATIONS:
+            raise ValueError(
+                f"Unsupported upscale_interpolation '{upscale_interpolation}', "
+                f"expected one of {sorted(UPSCALE_INTERPOLATIONS)}"
+            )
+
         self.model_img_size = model_img_size
+        self.upscale_interpolation = UPSCALE_INTERPOLATIONS[upscale_interpolation]
         self.bbox_inc = bbox_inc
         self.enable_temporal_smoothing = enable_temporal_smoothing
         self.logit_threshold = probability_to_logit_threshold(confidence_threshold)
 
         self.ort_session, self.input_name = self._init_session_(model_path)
+        self.session_binding = (
+            SessionBinding(self.ort_session) if self.ort_session else None
+        )
+        self.input_dtype = get_input_dtype(self.ort_session)
+        self._warmup_(warmup_batch_sizes)
 
         if self.enable_temporal_smoothing:
             if temporal_alpha is None:
@@ -45,11 +63,24 @@ class LivenessDetector:
         else:
             self.temporal_smoother = None
 
+        self.stable_cache = StableLivenessCache(stable_frames, stable_recheck_period)
+
         self.frame_counter = 0
 
     def _init_session_(self, onnx_model_path: str):
         return init_onnx_session(onnx_model_path)
 
+    def _warmup_(self, batch_sizes: Sequence[int]):
+        # First runs pay for CUDA context, cuDNN algo search and TensorRT
+        # engine builds; take that hit at load instead of on the first frame
+        if self.session_binding is None:
+            return
+
+        size = self.model_img_size
+        for batch_size in batch_sizes:
+            dummy = np.zeros((batch_size, 3, size, size), dtype=self.input_dtype)
+            self.session_binding.run(self.input_name, dummy)
+
     def increased_crop(
         self, img: np.ndarray, bbox: tuple, bbox_inc: float
     ) -> np.ndarray:
@@ -63,28 +94,19 @@ class LivenessDetector:
 
         self.frame_counter += 1
 
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
-        results = []
-        valid_detections_for_cropping = []
-
-        for detection in face_detections:
-            is_valid, liveness_status = validate_detection(detection)
-
-            if not is_valid:
-                if liveness_status:
-                    detection["liveness"] = liveness_status
-                results.append(detection)
-                continue
+        bboxes, detections_to_crop, results = bboxes_to_array(face_detections)
 
-            valid_detections_for_cropping.append(detection)
+        if self.stable_cache.enabled and detections_to_crop:
+            bboxes, detections_to_crop = self._apply_stable_cache(
+                bboxes, detections_to_crop, results
+            )
 
-        face_crops, valid_detections, skipped_results = (
+        face_crops, valid_detections, skipped_results, crop_indices = (
             extract_face_crops_from_detections(
-                rgb_image,
-                valid_detections_for_cropping,
+                image,
+                bboxes,
+                detections_to_crop,
                 self.bbox_inc,
-                self.increased_crop,
             )
         )
 
@@ -108,7 +130,12 @@ class LivenessDetector:
             self.ort_session,
             self.input_name,
             self.model_img_size,
+            self.upscale_interpolation,
+            self.session_binding,
+            self.input_dtype,
         )
+        if len(face_crops) != len(valid_detections):
+            raw_logits = raw_logits[crop_indices]
 
         results = assemble_liveness_results(
             valid_detections,
@@ -119,7 +146,38 @@ class LivenessDetector:
             self.frame_counter,
         )
 
+        if self.stable_cache.enabled:
+            for detection in valid_detections:
+                self.stable_cache.update(
+                    detection.get("track_id"),
+                    detection["liveness"],
+                    self.logit_threshold,
+                    self.frame_counter,
+                )
+            self.stable_cache.cleanup_stale_tracks(self.frame_counter)
+
         if self.temporal_smoother:
             self.temporal_smoother.cleanup_stale_tracks()
 
         return results
+
+    def _apply_stable_cache(
+        self, bboxes: np.ndarray, detections: List[Dict], results: List[Dict]
+    ):
+        # Reuse the last verdict for stable live tracks; only the rest
+        # are cropped and sent to the model
+        needs_inference = np.ones(len(detections), dtype=bool)
+        for i, detection in enumerate(detections):
+            cached = self.stable_cache.lookup(
+                detection.get("track_id"), self.frame_counter
+            )
+            if cached is not None:
+                detection["liveness"] = cached
+                results.append(detection)
+                needs_inference[i] = False
+
+        if needs_inference.all():
+            return bboxes, detections
+
+        remaining = [d for d, keep in zip(detections, needs_inference) if keep]
+        return bboxes[needs_inference], remaining
@@ -1,6 +1,9 @@
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from .preprocess import preprocess_batch
+import onnxruntime as ort
+from typing import Dict, List
+from .preprocess import preprocess_batch, DEFAULT_UPSCALE_INTERPOLATION
+
+_RUN_OPTIONS = ort.RunOptions()
 
 
 def process_with_logits(raw_logits: np.ndarray, threshold: float) -> Dict:
@@ -11,46 +14,37 @@ def process_with_logits(raw_logits: np.ndarray, threshold: float) -> Dict:
     confidence = abs(logit_diff)
 
     return {
-        "is_real": bool(is_real),
+        "is_real": is_real,
         "status": "real" if is_real else "spoof",
-        "logit_diff": float(logit_diff),
-        "real_logit": float(real_logit),
-        "spoof_logit": float(spoof_logit),
-        "confidence": float(confidence),
+        "logit_diff": logit_diff,
+        "real_logit": real_logit,
+        "spoof_logit": spoof_logit,
+        "confidence": confidence,
     }
 
 
-def validate_detection(detection: Dict) -> Tuple[bool, Optional[Dict]]:
-    if "liveness" in detection and detection["liveness"].get("status") == "move_closer":
-        return False, None
-
-    bbox = detection.get("bbox", {})
-    if not isinstance(bbox, dict):
-        return False, None
-
-    w = float(bbox.get("width", 0))
-    h = float(bbox.get("height", 0))
-
-    if w <= 0 or h <= 0:
-        return False, None
-
-    return True, None
-
-
 def run_batch_inference(
     face_crops: List[np.ndarray],
     ort_session,
     input_name: str,
     model_img_size: int,
-) -> List[np.ndarray]:
+    upscale_interpolation: int = DEFAULT_UPSCALE_INTERPOLATION,
+    session_binding=None,
+    input_dtype: type = np.float32,
+) -> np.ndarray:
     if not face_crops:
-        return []
+        return np.empty((0, 2), dtype=np.float32)
 
     if not ort_session:
         raise RuntimeError("ONNX session is not available")
 
-    batch_input = preprocess_batch(face_crops, model_img_size)
-    logits = ort_session.run([], {input_name: batch_input})[0]
+    batch_input = preprocess_batch(
+        face_crops, model_img_size, upscale_interpolation, input_dtype
+    )
+    if session_binding is not None:
+        logits = session_binding.run(input_name, batch_input, _RUN_OPTIONS)
+    else:
+        logits = ort_session.run(None, {input_name: batch_input}, _RUN_OPTIONS)[0]
 
     if logits.shape != (len(face_crops), 2):
         raise ValueError(
@@ -58,12 +52,12 @@ def run_batch_inference(
             f"got {logits.shape}"
         )
 
-    return [logits[i] for i in range(len(face_crops))]
+    return logits
 
 
 def assemble_liveness_results(
     valid_detections: List[Dict],
-    raw_logits: List[np.ndarray],
+    raw_logits: np.ndarray,
     logit_threshold: float,
     results: List[Dict],
     temporal_smoother=None,
@@ -75,28 +69,52 @@ def assemble_liveness_results(
             f"{len(raw_logits)} predictions. This indicates a bug in the pipeline."
         )
 
-    for detection, logits in zip(valid_detections, raw_logits):
-        real_logit = float(logits[0])
-        spoof_logit = float(logits[1])
+    if not valid_detections:
+        return results
+
+    logits = np.asarray(raw_logits, dtype=np.float64).reshape(-1, 2)
+    real_logits = logits[:, 0].copy()
+    spoof_logits = logits[:, 1].copy()
 
-        if temporal_smoother:
+    if temporal_smoother:
+        tracked_indices = []
+        track_ids = []
+        for i, detection in enumerate(valid_detections):
             track_id = detection.get("track_id")
             if track_id is not None and track_id > 0:
-                real_logit, spoof_logit = temporal_smoother.smooth(
-                    track_id, real_logit, spoof_logit, frame_number
-                )
-
-        logit_diff = real_logit - spoof_logit
-        is_real = logit_diff >= logit_threshold
-        confidence = abs(logit_diff)
-
+                tracked_indices.append(i)
+                track_ids.append(track_id)
+
+        if tracked_indices:
+            (
+                real_logits[tracked_indices],
+                spoof_logits[tracked_indices],
+            ) = temporal_smoother.smooth_batch(
+                track_ids,
+                real_logits[tracked_indices],
+                spoof_logits[tracked_indices],
+                frame_number,
+            )
+
+    logit_diffs = real_logits - spoof_logits
+    is_real_flags = (logit_diffs >= logit_threshold).tolist()
+    confidences = np.abs(logit_diffs).tolist()
+
+    for detection, is_real, logit_diff, real_logit, spoof_logit, confidence in zip(
+        valid_detections,
+        is_real_flags,
+        logit_diffs.tolist(),
+        real_logits.tolist(),
+        spoof_logits.tolist(),
+        confidences,
+    ):
         detection["liveness"] = {
-            "is_real": bool(is_real),
+            "is_real": is_real,
             "status": "real" if is_real else "spoof",
-            "logit_diff": float(logit_diff),
-            "real_logit": float(real_logit),
-            "spoof_logit": float(spoof_logit),
-            "confidence": float(confidence),
+            "logit_diff": logit_diff,
+            "real_logit": real_logit,
+            "spoof_logit": spoof_logit,
+            "confidence": confidence,
         }
 
         results.append(detection)
@@ -1,16 +1,85 @@
 import cv2
+import os
+import threading
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple
+
+UPSCALE_INTERPOLATIONS = {
+    "linear": cv2.INTER_LINEAR,
+    "cubic": cv2.INTER_CUBIC,
+    "lanczos4": cv2.INTER_LANCZOS4,
+}
+DEFAULT_UPSCALE_INTERPOLATION = cv2.INTER_LINEAR
+MAX_POOLED_BATCH_SHAPES = 8
+PARALLEL_PREPROCESS_MIN_CROPS = 4
+PREPROCESS_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# cv2 releases the GIL, so crops of a large batch are letterboxed concurrently
+_preprocess_executor = ThreadPoolExecutor(
+    max_workers=PREPROCESS_WORKERS,
+    thread_name_prefix="liveness-preprocess",
+)
+
+# Per-thread staging and batch tensors, reused across frames
+_batch_pool = threading.local()
+
+
+def get_staging_buffer(n: int, model_img_size: int) -> np.ndarray:
+    # One uint8 NHWC buffer per thread, grown on demand; callers get a view
+    # of its first n slots
+    staging = getattr(_batch_pool, "staging", None)
+    if staging is None or staging.shape[0] < n or staging.shape[1] != model_img_size:
+        capacity = max(n, 0 if staging is None else staging.shape[0])
+        staging = np.empty(
+            (capacity, model_img_size, model_img_size, 3), dtype=np.uint8
+        )
+        _batch_pool.staging = staging
+
+    return staging[:n]
+
+
+def get_batch_buffer(
+    n: int, model_img_size: int, dtype: type = np.float32
+) -> np.ndarray:
+    pool = getattr(_batch_pool, "buffers", None)
+    if pool is None:
+        pool = _batch_pool.buffers = {}
 
+    key = (n, model_img_size, np.dtype(dtype).str)
+    buffer = pool.get(key)
+    if buffer is None:
+        if len(pool) >= MAX_POOLED_BATCH_SHAPES:
+            pool.clear()
+        buffer = np.empty((n, 3, model_img_size, model_img_size), dtype=dtype)
+        pool[key] = buffer
 
-def preprocess(img: np.ndarray, model_img_size: int) -> np.ndarray:
+    return buffer
+
+
+def letterbox(
+    img: np.ndarray,
+    model_img_size: int,
+    dst: np.ndarray,
+    upscale_interpolation: int = DEFAULT_UPSCALE_INTERPOLATION,
+) -> np.ndarray:
     new_size = model_img_size
     old_size = img.shape[:2]
 
+    if old_size[0] == old_size[1]:
+        # Square crops (all crop_window output) need no letterbox: resize
+        # straight into the destination instead of resize + border pass
+        interpolation = (
+            upscale_interpolation if new_size > old_size[0] else cv2.INTER_AREA
+        )
+        return cv2.resize(
+            img, (new_size, new_size), dst=dst, interpolation=interpolation
+        )
+
     ratio = float(new_size) / max(old_size)
     scaled_shape = tuple([int(x * ratio) for x in old_size])
 
-    interpolation = cv2.INTER_LANCZOS4 if ratio > 1.0 else cv2.INTER_AREA
+    interpolation = upscale_interpolation if ratio > 1.0 else cv2.INTER_AREA
     img = cv2.resize(
         img, (scaled_shape[1], scaled_shape[0]), interpolation=interpolation
     )
@@ -20,27 +89,87 @@ def preprocess(img: np.ndarray, model_img_size: int) -> np.ndarray:
     top, bottom = delta_h // 2, delta_h - (delta_h // 2)
     left, right = delta_w // 2, delta_w - (delta_w // 2)
 
-    img = cv2.copyMakeBorder(img, top, bottom, left, right, cv2.BORDER_REFLECT_101)
-    img = img.transpose(2, 0, 1).astype(np.float32) / 255.0
+    return cv2.copyMakeBorder(
+        img, top, bottom, left, right, cv2.BORDER_REFLECT_101, dst=dst
+    )
+
 
-    return img
+def preprocess(
+    img: np.ndarray,
+    model_img_size: int,
+    upscale_interpolation: int = DEFAULT_UPSCALE_INTERPOLATION,
+) -> np.ndarray:
+    return preprocess_batch([img], model_img_size, upscale_interpolation)[0].copy()
 
 
-def preprocess_batch(face_crops: List[np.ndarray], model_img_size: int) -> np.ndarray:
+def preprocess_batch(
+    face_crops: List[np.ndarray],
+    model_img_size: int,
+    upscale_interpolation: int = DEFAULT_UPSCALE_INTERPOLATION,
+    dtype: type = np.float32,
+) -> np.ndarray:
     if not face_crops:
         raise ValueError("face_crops list cannot be empty")
 
-    batch = np.zeros(
-        (len(face_crops), 3, model_img_size, model_img_size), dtype=np.float32
-    )
-    for i, face_crop in enumerate(face_crops):
-        batch[i] = preprocess(face_crop, model_img_size)
+    n = len(face_crops)
+    batch_u8 = get_staging_buffer(n, model_img_size)
+    if n >= PARALLEL_PREPROCESS_MIN_CROPS and PREPROCESS_WORKERS > 1:
+        # Each task writes its own batch slot, so no locking is needed
+        list(
+            _preprocess_executor.map(
+                lambda i: letterbox(
+                    face_crops[i], model_img_size, batch_u8[i], upscale_interpolation
+                ),
+                range(n),
+            )
+        )
+    else:
+        for i, face_crop in enumerate(face_crops):
+            letterbox(face_crop, model_img_size, batch_u8[i], upscale_interpolation)
+
+    # Crops are BGR; BGR->RGB, HWC->CHW and scaling happen in one pass.
+    # The returned batch is pooled and only valid until the next call.
+    batch = get_batch_buffer(n, model_img_size, dtype)
+    np.divide(batch_u8[..., ::-1].transpose(0, 3, 1, 2), np.float32(255.0), out=batch)
 
     return batch
 
 
-def crop(img: np.ndarray, bbox: tuple, bbox_inc: float) -> np.ndarray:
+def compute_crop_windows(
+    bboxes: np.ndarray, bbox_inc: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    x, y, w, h = bboxes[:, 0], bboxes[:, 1], bboxes[:, 2], bboxes[:, 3]
+
+    max_dim = np.maximum(w, h)
+    xc = x + w / 2
+    yc = y + h / 2
+
+    crop_x = (xc - max_dim * bbox_inc / 2).astype(np.int64)
+    crop_y = (yc - max_dim * bbox_inc / 2).astype(np.int64)
+    crop_sizes = (max_dim * bbox_inc).astype(np.int64)
+
+    return crop_x, crop_y, crop_sizes
+
+
+def crop_window(img: np.ndarray, x: int, y: int, crop_size: int) -> np.ndarray:
+    # Common case: the window lies inside the frame, so a view is enough
     real_h, real_w = img.shape[:2]
+    if x >= 0 and y >= 0 and x + crop_size <= real_w and y + crop_size <= real_h:
+        return img[y : y + crop_size, x : x + crop_size]
+
+    # Translate the square window to the origin; REFLECT_101 fills whatever
+    # part of it falls outside the frame, so the output is always square
+    translation = np.array([[1, 0, -x], [0, 1, -y]], dtype=np.float32)
+    return cv2.warpAffine(
+        img,
+        translation,
+        (crop_size, crop_size),
+        flags=cv2.INTER_NEAREST,
+        borderMode=cv2.BORDER_REFLECT_101,
+    )
+
+
+def crop(img: np.ndarray, bbox: tuple, bbox_inc: float) -> np.ndarray:
     x, y, w, h = bbox
 
     w = w - x
@@ -49,98 +178,104 @@ def crop(img: np.ndarray, bbox: tuple, bbox_inc: float) -> np.ndarray:
     if w <= 0 or h <= 0:
         raise ValueError("Invalid bbox dimensions")
 
-    max_dim = max(w, h)
-    xc = x + w / 2
-    yc = y + h / 2
+    crop_x, crop_y, crop_sizes = compute_crop_windows(
+        np.array([[x, y, w, h]], dtype=np.float64), bbox_inc
+    )
+    if crop_sizes[0] <= 0:
+        raise ValueError("Invalid crop size")
 
-    x = int(xc - max_dim * bbox_inc / 2)
-    y = int(yc - max_dim * bbox_inc / 2)
-    crop_size = int(max_dim * bbox_inc)
+    return crop_window(img, int(crop_x[0]), int(crop_y[0]), int(crop_sizes[0]))
 
-    crop_x1 = max(0, x)
-    crop_y1 = max(0, y)
-    crop_x2 = min(real_w, x + crop_size)
-    crop_y2 = min(real_h, y + crop_size)
 
-    top_pad = int(max(0, -y))
-    left_pad = int(max(0, -x))
-    bottom_pad = int(max(0, (y + crop_size) - real_h))
-    right_pad = int(max(0, (x + crop_size) - real_w))
+def bboxes_to_array(
+    detections: List[Dict],
+) -> Tuple[np.ndarray, List[Dict], List[Dict]]:
+    rows = []
+    row_indices = []
 
-    if crop_x2 > crop_x1 and crop_y2 > crop_y1:
-        img = img[crop_y1:crop_y2, crop_x1:crop_x2, :]
-    else:
-        img = np.zeros((0, 0, 3), dtype=img.dtype)
+    for index, detection in enumerate(detections):
+        liveness = detection.get("liveness")
+        if liveness is not None and liveness.get("status") == "move_closer":
+            continue
 
-    result = cv2.copyMakeBorder(
-        img,
-        top_pad,
-        bottom_pad,
-        left_pad,
-        right_pad,
-        cv2.BORDER_REFLECT_101,
-    )
+        bbox = detection.get("bbox")
+        if not isinstance(bbox, dict):
+            continue
 
-    if result.shape[0] != crop_size or result.shape[1] != crop_size:
-        raise ValueError(
-            f"Crop size mismatch: expected {crop_size}x{crop_size}, got {result.shape[0]}x{result.shape[1]}"
+        rows.append(
+            (
+                bbox.get("x", 0),
+                bbox.get("y", 0),
+                bbox.get("width", 0),
+                bbox.get("height", 0),
+            )
         )
+        row_indices.append(index)
 
-    return result
-
+    if not rows:
+        return np.empty((0, 4), dtype=np.float64), [], list(detections)
 
-def extract_bbox_coordinates(
-    detection: Dict,
-) -> Optional[Tuple[float, float, float, float]]:
-    bbox = detection.get("bbox", {})
-    if not isinstance(bbox, dict):
-        return None
+    bboxes = np.array(rows, dtype=np.float64)
+    has_area = (bboxes[:, 2] > 0) & (bboxes[:, 3] > 0)
+    bboxes = bboxes[has_area]
 
-    x = float(bbox.get("x", 0))
-    y = float(bbox.get("y", 0))
-    w = float(bbox.get("width", 0))
-    h = float(bbox.get("height", 0))
+    is_valid = np.zeros(len(detections), dtype=bool)
+    is_valid[np.asarray(row_indices)[has_area]] = True
 
-    if w <= 0 or h <= 0:
-        return None
+    valid_detections = []
+    invalid_detections = []
+    for detection, valid in zip(detections, is_valid.tolist()):
+        if valid:
+            valid_detections.append(detection)
+        else:
+            invalid_detections.append(detection)
 
-    return (x, y, w, h)
+    return bboxes, valid_detections, invalid_detections
 
 
 def extract_face_crops_from_detections(
-    rgb_image: np.ndarray,
+    image: np.ndarray,
+    bboxes: np.ndarray,
     detections: List[Dict],
     bbox_inc: float,
-    crop_fn,
-) -> Tuple[List[np.ndarray], List[Dict], List[Dict]]:
+) -> Tuple[List[np.ndarray], List[Dict], List[Dict], List[int]]:
     face_crops = []
     valid_detections = []
     skipped_results = []
+    crop_indices = []
+
+    if not detections:
+        return face_crops, valid_detections, skipped_results, crop_indices
+
+    if image.ndim != 3 or image.shape[2] != 3:
+        return face_crops, valid_detections, list(detections), crop_indices
+
+    crop_x, crop_y, crop_sizes = compute_crop_windows(bboxes, bbox_inc)
 
-    for detection in detections:
-        bbox_coords = extract_bbox_coordinates(detection)
-        if bbox_coords is None:
+    # Detections with the same window (duplicate tracker or NMS output) share
+    # one crop; crop_indices maps each valid detection to its batch row
+    window_rows: Dict[Tuple[int, int, int], int] = {}
+
+    for detection, x, y, crop_size in zip(
+        detections, crop_x.tolist(), crop_y.tolist(), crop_sizes.tolist()
+    ):
+        if crop_size <= 0:
             skipped_results.append(detection)
             continue
 
-        x, y, w, h = bbox_coords
-
-        try:
-            face_crop = crop_fn(rgb_image, (x, y, x + w, y + h), bbox_inc)
-            if len(face_crop.shape) != 3 or face_crop.shape[2] != 3:
+        window = (x, y, crop_size)
+        row = window_rows.get(window)
+        if row is None:
+            try:
+                face_crop = crop_window(image, x, y, crop_size)
+            except Exception:
                 skipped_results.append(detection)
                 continue
-            if face_crop.shape[0] != face_crop.shape[1]:
-                skipped_results.append(detection)
-                continue
-        except (ValueError, IndexError):
-            skipped_results.append(detection)
-            continue
-        except Exception:
-            skipped_results.append(detection)
-            continue
 
-        face_crops.append(face_crop)
+            row = window_rows[window] = len(face_crops)
+            face_crops.append(face_crop)
+
+        crop_indices.append(row)
         valid_detections.append(detection)
 
-    return face_crops, valid_detections, skipped_results
+    return face_crops, valid_detections, skipped_results, crop_indices
@@ -0,0 +1,90 @@
+from typing import Dict, Optional
+
+
+class _TrackState:
+    __slots__ = ("liveness", "streak", "last_inferred", "last_seen")
+
+    def __init__(self):
+        self.liveness: Optional[Dict] = None
+        self.streak = 0
+        self.last_inferred = -1
+        self.last_seen = -1
+
+
+class StableLivenessCache:
+    def __init__(
+        self,
+        stable_frames: int,
+        recheck_period: int,
+        min_logit_margin: float = 1.0,
+        max_stale_frames: int = 30,
+        cleanup_interval: int = 10,
+    ):
+        self.stable_frames = max(1, stable_frames)
+        self.recheck_period = max(0, recheck_period)
+        self.min_logit_margin = min_logit_margin
+        self.max_stale_frames = max_stale_frames
+        self.cleanup_interval = cleanup_interval
+        self.last_cleanup_frame = 0
+        self.tracks: Dict[int, _TrackState] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.recheck_period > 1
+
+    def lookup(self, track_id, frame_number: int) -> Optional[Dict]:
+        # Only confidently live tracks are skipped, and never for longer than
+        # recheck_period frames, so a spoof swapped into a track is re-caught
+        if not self.enabled or track_id is None or track_id <= 0:
+            return None
+
+        state = self.tracks.get(track_id)
+        if (
+            state is None
+            or state.streak < self.stable_frames
+            or frame_number - state.last_inferred >= self.recheck_period
+        ):
+            return None
+
+        state.last_seen = frame_number
+        return dict(state.liveness)
+
+    def update(
+        self, track_id, liveness: Dict, logit_threshold: float, frame_number: int
+    ):
+        if not self.enabled or track_id is None or track_id <= 0:
+            return
+
+        state = self.tracks.get(track_id)
+        if state is None:
+            state = self.tracks[track_id] = _TrackState()
+
+        if (
+            liveness.get("is_real")
+            and liveness["logit_diff"] >= logit_threshold + self.min_logit_margin
+        ):
+            state.streak += 1
+        else:
+            state.streak = 0
+
+        state.liveness = dict(liveness)
+        state.last_inferred = frame_number
+        state.last_seen = frame_number
+
+    def cleanup_stale_tracks(self, frame_number: int):
+        if frame_number - self.last_cleanup_frame < self.cleanup_interval:
+            return
+
+        stale_ids = [
+            track_id
+            for track_id, state in self.tracks.items()
+            if frame_number - state.last_seen > self.max_stale_frames
+        ]
+        for track_id in stale_ids:
+            del self.tracks[track_id]
+
+        self.last_cleanup_frame = frame_number
+
+    def reset(self):
+        self.tracks.clear()
+        self.last_cleanup_frame = 0
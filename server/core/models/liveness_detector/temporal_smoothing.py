@@ -1,23 +1,62 @@
-from collections import defaultdict
-from typing import Tuple
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
 
 
 class TemporalSmoother:
     def __init__(
-        self, alpha: float, max_stale_frames: int = 30, cleanup_interval: int = 10
+        self,
+        alpha: float,
+        max_stale_frames: int = 30,
+        cleanup_interval: int = 10,
+        capacity_step: int = 64,
     ):
         self.alpha = max(0.0, min(1.0, alpha))
         self.max_stale_frames = max_stale_frames
         self.cleanup_interval = cleanup_interval
+        self.capacity_step = capacity_step
         self.current_frame = 0
         self.last_cleanup_frame = 0
-        self.track_states = defaultdict(
-            lambda: {"live": None, "spoof": None, "last_frame": -1}
+        self._allocate_state(capacity_step)
+
+    def _allocate_state(self, capacity: int):
+        # Per-track EMA state stored column-wise; track_slots maps id -> row
+        self.track_slots: Dict[int, int] = {}
+        self.free_slots: List[int] = list(range(capacity - 1, -1, -1))
+        # Logit EMAs need far less than float64 precision
+        self.live_state = np.zeros(capacity, dtype=np.float32)
+        self.spoof_state = np.zeros(capacity, dtype=np.float32)
+        self.last_frame = np.full(capacity, -1, dtype=np.int64)
+
+    def _grow(self):
+        capacity = len(self.last_frame)
+        new_capacity = capacity + self.capacity_step
+        self.live_state = np.concatenate(
+            [self.live_state, np.zeros(self.capacity_step, dtype=np.float32)]
+        )
+        self.spoof_state = np.concatenate(
+            [self.spoof_state, np.zeros(self.capacity_step, dtype=np.float32)]
         )
+        self.last_frame = np.concatenate(
+            [self.last_frame, np.full(self.capacity_step, -1, dtype=np.int64)]
+        )
+        self.free_slots.extend(range(new_capacity - 1, capacity - 1, -1))
 
-    def smooth(
-        self, track_id: int, real_score: float, spoof_score: float, frame_number: int
-    ) -> Tuple[float, float]:
+    def _slot_for(self, track_id: int) -> int:
+        slot = self.track_slots.get(track_id)
+        if slot is None:
+            if not self.free_slots:
+                self._grow()
+            slot = self.free_slots.pop()
+            self.track_slots[track_id] = slot
+        return slot
+
+    def smooth_batch(
+        self,
+        track_ids: Sequence[int],
+        real_scores: np.ndarray,
+        spoof_scores: np.ndarray,
+        frame_number: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
         if frame_number < 0:
             frame_number = 0
 
@@ -25,23 +64,45 @@ class TemporalSmoother:
             frame_number = self.current_frame
 
         self.current_frame = frame_number
-        state = self.track_states[track_id]
-
-        if state["live"] is None or state["spoof"] is None:
-            smoothed_live = real_score
-            smoothed_spoof = spoof_score
-        else:
-            smoothed_live = self.alpha * real_score + (1 - self.alpha) * state["live"]
-            smoothed_spoof = (
-                self.alpha * spoof_score + (1 - self.alpha) * state["spoof"]
-            )
 
-        state["live"] = smoothed_live
-        state["spoof"] = smoothed_spoof
-        state["last_frame"] = frame_number
+        slots = np.fromiter(
+            (self._slot_for(track_id) for track_id in track_ids),
+            dtype=np.intp,
+            count=len(track_ids),
+        )
+        real_scores = np.asarray(real_scores, dtype=np.float64)
+        spoof_scores = np.asarray(spoof_scores, dtype=np.float64)
+
+        is_new = self.last_frame[slots] < 0
+        smoothed_live = np.where(
+            is_new,
+            real_scores,
+            self.alpha * real_scores + (1 - self.alpha) * self.live_state[slots],
+        )
+        smoothed_spoof = np.where(
+            is_new,
+            spoof_scores,
+            self.alpha * spoof_scores + (1 - self.alpha) * self.spoof_state[slots],
+        )
+
+        self.live_state[slots] = smoothed_live
+        self.spoof_state[slots] = smoothed_spoof
+        self.last_frame[slots] = frame_number
 
         return smoothed_live, smoothed_spoof
 
+    def smooth(
+        self, track_id: int, real_score: float, spoof_score: float, frame_number: int
+    ) -> Tuple[float, float]:
+        # Untracked (non-positive) ids are transient: never allocate state
+        if track_id <= 0:
+            return real_score, spoof_score
+
+        smoothed_live, smoothed_spoof = self.smooth_batch(
+            [track_id], [real_score], [spoof_score], frame_number
+        )
+        return float(smoothed_live[0]), float(smoothed_spoof[0])
+
     def cleanup_stale_tracks(self, force: bool = False):
         if (
             not force
@@ -50,23 +111,24 @@ class TemporalSmoother:
         ):
             return
 
-        stale_tracks = [
-            track_id
-            for track_id, state in self.track_states.items()
-            if self.current_frame - state["last_frame"] > self.max_stale_frames
-        ]
-
-        negative_tracks = [
-            track_id for track_id in self.track_states.keys() if track_id < 0
-        ]
-        stale_tracks.extend(negative_tracks)
+        if self.track_slots:
+            track_ids = list(self.track_slots)
+            slots = np.fromiter(
+                self.track_slots.values(), dtype=np.intp, count=len(track_ids)
+            )
+            stale = (self.current_frame - self.last_frame[slots]) > (
+                self.max_stale_frames
+            )
 
-        for track_id in stale_tracks:
-            del self.track_states[track_id]
+            for track_id, slot, is_stale in zip(track_ids, slots.tolist(), stale):
+                if is_stale:
+                    del self.track_slots[track_id]
+                    self.last_frame[slot] = -1
+                    self.free_slots.append(slot)
 
         self.last_cleanup_frame = self.current_frame
 
     def reset(self):
-        self.track_states.clear()
+        self._allocate_state(self.capacity_step)
         self.current_frame = 0
         self.last_cleanup_frame = 0
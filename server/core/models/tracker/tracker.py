@@ -163,7 +163,7 @@ class FaceTracker:
                         best_iou = iou_matrix[track_idx, best_det_idx]
 
                         if best_iou >= self.min_iou:
-                            face_result = face_detections[best_det_idx].copy()
+                            face_result = face_detections[best_det_idx]
                             face_result["track_id"] = int(track.track_id)
 
                             result.append(face_result)
@@ -175,10 +175,8 @@ class FaceTracker:
         # Add unmatched detections with negative track IDs
         for det_idx, face in enumerate(face_detections):
             if det_idx not in matched_detection_indices:
-                face_result = face.copy()
-                face_result["track_id"] = -(det_idx + 1)
-
-                result.append(face_result)
+                face["track_id"] = -(det_idx + 1)
+                result.append(face)
 
         return result
 
@@ -30,6 +30,12 @@ class FaceDatabaseManager:
         self.database_path = Path(database_path)
         self.lock = threading.Lock()
 
+        # One long-lived connection per thread: the WAL (and its -wal file)
+        # is checkpointed away whenever the last connection closes
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
         # Ensure directory exists
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -42,6 +48,12 @@ class FaceDatabaseManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
+                # WAL persists in the file: single-row writes append to the
+                # log instead of rewriting pages, and readers never block.
+                # The log stays in place while the per-thread connections
+                # below are open
+                cursor.execute("PRAGMA journal_mode=WAL")
+
                 # Create faces table
                 cursor.execute(
                     """
@@ -80,26 +92,72 @@ class FaceDatabaseManager:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for this database"""
+        conn = sqlite3.connect(
+            self.database_path,
+            timeout=30.0,  # 30 second timeout
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.execute("PRAGMA synchronous=NORMAL")  # Durable with WAL
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _drop_connection(self, conn: sqlite3.Connection):
+        """Close a connection and forget it"""
+        with self._connections_lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        if getattr(self._local, "conn", None) is conn:
+            self._local.conn = None
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
     @contextmanager
     def _get_connection(self):
-        """Get a database connection with proper error handling"""
+        """Get this thread's database connection with proper error handling"""
         conn = None
         try:
-            conn = sqlite3.connect(
-                self.database_path,
-                timeout=30.0,  # 30 second timeout
-                check_same_thread=False,
-            )
-            conn.row_factory = sqlite3.Row  # Enable column access by name
+            conn = getattr(self._local, "conn", None)
+            if conn is None:
+                conn = self._connect()
+                self._local.conn = conn
             yield conn
         except Exception as e:
             if conn:
-                conn.rollback()
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    # Unusable connection; reopen on the next call
+                    self._drop_connection(conn)
             logger.error(f"Database connection error: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
+
+    def get_file_signature(self) -> Tuple:
+        """
+        Get a cheap signature of the database files for change detection
+
+        Covers the main file and its WAL, so any committed write changes it.
+
+        Returns:
+            Tuple: (mtime_ns, size) per file, None for a missing file
+        """
+        signature = []
+        for path in (
+            self.database_path,
+            self.database_path.with_name(self.database_path.name + "-wal"),
+        ):
+            try:
+                stat = path.stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+
+        return tuple(signature)
 
     def _embedding_to_blob(self, embedding: np.ndarray) -> bytes:
         """Convert numpy embedding to binary blob"""
@@ -144,6 +202,46 @@ class FaceDatabaseManager:
             logger.error(f"Failed to add person {person_id}: {e}")
             return False
 
+    def add_persons(self, entries: List[Tuple[str, np.ndarray]]) -> bool:
+        """
+        Add or update several face embeddings in a single transaction
+
+        Args:
+            entries: List of (person_id, embedding) pairs
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not entries:
+            return True
+
+        try:
+            with self.lock:
+                with self._get_connection() as conn:
+                    cursor = conn.cursor()
+
+                    cursor.executemany(
+                        """
+                        INSERT OR REPLACE INTO faces (person_id, embedding, embedding_dimension)
+                        VALUES (?, ?, ?)
+                    """,
+                        [
+                            (
+                                person_id,
+                                self._embedding_to_blob(embedding),
+                                len(embedding),
+                            )
+                            for person_id, embedding in entries
+                        ],
+                    )
+
+                    conn.commit()
+                    return True
+
+        except Exception as e:
+            logger.error(f"Failed to add {len(entries)} persons: {e}")
+            return False
+
     def get_person(self, person_id: str) -> Optional[np.ndarray]:
         """
         Get a person's face embedding
@@ -483,11 +581,23 @@ class FaceDatabaseManager:
 
     def close(self):
         """
-        Close the database connection
+        Close the database connections opened by every thread
 
-        Note: This class uses context managers for connections,
-        so there's no persistent connection to close.
+        The last close checkpoints the WAL back into the main file.
         """
+        connections = getattr(self, "_connections", None)
+        if not connections:
+            return
+
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
 
     def __del__(self):
         """Destructor to ensure proper cleanup"""
@@ -1,3 +1,4 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from config.paths import DATA_DIR
 
@@ -11,6 +12,25 @@ engine = create_async_engine(
     echo=False,
 )
 
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # Readers no longer block on the writer
+    "PRAGMA synchronous=NORMAL",  # Durable with WAL, fewer fsyncs per commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",  # 128 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
@@ -3,17 +3,23 @@ Hooks package for request processing pipelines
 """
 
 from .face_processing import (
+    run_in_pipeline,
+    process_frame,
     process_face_detection,
     process_liveness_detection,
     process_face_tracking,
     process_liveness_for_face_operation,
+    release_frame_cache,
     set_model_references,
 )
 
 __all__ = [
+    "run_in_pipeline",
+    "process_frame",
     "process_face_detection",
     "process_liveness_detection",
     "process_face_tracking",
     "process_liveness_for_face_operation",
+    "release_frame_cache",
     "set_model_references",
 ]
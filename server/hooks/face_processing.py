@@ -1,10 +1,21 @@
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# The detector and liveness sessions keep per-call state (input size, IO
+# binding, temporal smoothing), so every model call goes through one worker
+# thread. That keeps them serialized while the event loop stays free to
+# receive and decode frames, and to serve other clients.
+_pipeline_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="face-pipeline"
+)
+
 liveness_detector = None
 face_recognizer = None
 face_detector = None
@@ -17,12 +28,48 @@ def set_model_references(liveness, tracker, recognizer, detector=None):
     face_detector = detector
 
 
+async def run_in_pipeline(func: Callable, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _pipeline_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+def process_frame(
+    image: np.ndarray,
+    confidence_threshold: Optional[float] = None,
+    nms_threshold: Optional[float] = None,
+    min_face_size: Optional[int] = None,
+    enable_liveness: bool = False,
+    frame_rate: int = None,
+    client_id: str = None,
+) -> List[Dict]:
+    faces = process_face_detection(
+        image,
+        confidence_threshold=confidence_threshold,
+        nms_threshold=nms_threshold,
+        min_face_size=min_face_size,
+        enable_liveness=enable_liveness,
+        cache_key=client_id,
+    )
+
+    if client_id:
+        faces = process_face_tracking(faces, image, frame_rate, client_id)
+    else:
+        for face in faces:
+            if "track_id" not in face:
+                face["track_id"] = -1
+
+    return process_liveness_detection(faces, image, enable_liveness)
+
+
 def process_face_detection(
     image: np.ndarray,
     confidence_threshold: Optional[float] = None,
     nms_threshold: Optional[float] = None,
     min_face_size: Optional[int] = None,
     enable_liveness: bool = False,
+    cache_key: Optional[str] = None,
 ) -> List[Dict]:
     if not face_detector:
         logger.warning("Face detector not available")
@@ -36,7 +83,7 @@ def process_face_detection(
         if min_face_size is not None:
             face_detector.set_min_face_size(min_face_size)
 
-        faces = face_detector.detect_faces(image, enable_liveness)
+        faces = face_detector.detect_faces(image, enable_liveness, cache_key)
         return faces
 
     except Exception as e:
@@ -44,6 +91,11 @@ def process_face_detection(
         return []
 
 
+def release_frame_cache(client_id: str):
+    if face_detector:
+        face_detector.clear_frame_cache(client_id)
+
+
 def process_liveness_detection(
     faces: List[Dict], image: np.ndarray, enable: bool
 ) -> List[Dict]:
@@ -1,58 +1,44 @@
 import argparse
 import logging
 import logging.config
-import signal
 import sys
 import traceback
 from pathlib import Path
 
-import uvicorn
-
-from config.models import validate_model_paths, validate_directories
-from config.logging_config import LOGGING_CONFIG
-from config.server import get_server_config
-from database.migrate import run_migrations
-
-config = {
-    "server": get_server_config(),
-    "logging": LOGGING_CONFIG,
-}
-
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
+# uvicorn, the config package (which pulls in onnxruntime) and the app are
+# imported inside the functions below, so importing this module stays cheap
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully"""
-    signal_name = (
-        "SIGINT"
-        if signum == signal.SIGINT
-        else "SIGTERM" if signum == signal.SIGTERM else f"Signal {signum}"
-    )
-    print(f"\nReceived {signal_name} - shutting down gracefully...")
-    sys.exit(0)
+_logging_configured = False
 
 
-# Register signal handlers for graceful shutdown
-signal.signal(signal.SIGINT, signal_handler)  # Ctrl+C
-signal.signal(signal.SIGTERM, signal_handler)  # Termination request
+def load_config():
+    """Load server and logging configuration"""
+    from config.logging_config import LOGGING_CONFIG
+    from config.server import get_server_config
 
-# Windows-specific signal handling
-if sys.platform == "win32":
-    try:
-        signal.signal(signal.SIGBREAK, signal_handler)  # Windows Ctrl+Break
-    except AttributeError:
-        pass  # SIGBREAK not available on all platforms
+    return {
+        "server": get_server_config(),
+        "logging": LOGGING_CONFIG,
+    }
 
 
-def setup_logging():
-    """Setup logging configuration"""
-    logging.config.dictConfig(config["logging"])
+def setup_logging(logging_config):
+    """Setup logging configuration (once per process)"""
+    global _logging_configured
+    if _logging_configured:
+        return
+    logging.config.dictConfig(logging_config)
+    _logging_configured = True
 
 
 def validate_setup():
     """Validate the setup before starting the server"""
+    from config.models import validate_model_paths, validate_directories
+
     try:
         # Validate directories
         validate_directories()
@@ -76,8 +62,14 @@ def main():
     parser.add_argument("--host", type=str, help="Host to run the server on")
     args = parser.parse_args()
 
+    import uvicorn
+    from config.logging_config import get_multiprocess_logging_config
+    from database.migrate import run_migrations
+
+    config = load_config()
+
     # Setup logging
-    setup_logging()
+    setup_logging(config["logging"])
     logger = logging.getLogger(__name__)
 
     # Validate setup
@@ -96,15 +88,31 @@ def main():
     if args.host:
         server_config["host"] = args.host
 
+    # uvicorn can only spawn workers (or reload) from an import string; a
+    # frozen PyInstaller build has no importable "main" module, so it runs
+    # the imported app object in a single process
+    frozen = getattr(sys, "frozen", False)
+    if frozen:
+        server_config["reload"] = False
+    if frozen or server_config["reload"]:
+        server_config["workers"] = 1
+    use_import_string = server_config["reload"] or server_config["workers"] > 1
+
     try:
-        # Import the app directly for PyInstaller compatibility
-        from main import app
+        if use_import_string:
+            app = "main:app"
+        else:
+            # Import the app directly for PyInstaller compatibility
+            from main import app
 
         logger.info(
-            f"Starting server on {server_config['host']}:{server_config['port']}"
+            f"Starting server on {server_config['host']}:{server_config['port']} "
+            f"(workers={server_config['workers']}, loop={server_config['loop']}, "
+            f"http={server_config['http']})"
         )
 
-        # Start the server
+        # Start the server; uvicorn installs its own SIGINT/SIGTERM (and
+        # Windows SIGBREAK) handlers and runs the lifespan shutdown
         uvicorn.run(
             app,
             host=server_config["host"],
@@ -112,7 +120,16 @@ def main():
             reload=server_config["reload"],
             log_level=server_config["log_level"],
             workers=server_config["workers"],
-            access_log=True,
+            loop=server_config["loop"],
+            http=server_config["http"],
+            access_log=server_config["access_log"],
+            # Logging is already configured in this process; spawned workers
+            # start fresh and need a config, but must not open server.log
+            log_config=(
+                get_multiprocess_logging_config(config["logging"])
+                if use_import_string
+                else None
+            ),
         )
 
         logger.info("Server stopped gracefully")
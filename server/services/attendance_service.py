@@ -10,6 +10,9 @@ from utils.image_utils import decode_base64_image
 
 logger = logging.getLogger(__name__)
 
+# Registrations decoded and embedded per pipeline call in bulk_register
+BULK_REGISTER_CHUNK_SIZE = 8
+
 
 class AttendanceService:
     def __init__(
@@ -361,7 +364,7 @@ class AttendanceService:
             raise ValueError("Face bounding box required")
 
         try:
-            image = decode_base64_image(image_data)
+            image = await asyncio.to_thread(decode_base64_image, image_data)
         except Exception as e:
             raise ValueError(f"Invalid image data: {str(e)}")
 
@@ -372,7 +375,11 @@ class AttendanceService:
         # Register the face
         logger.info(f"Registering face for {person_id} in group {group_id}")
 
-        result = self.face_recognizer.register_person(person_id, image, landmarks_5)
+        from hooks import run_in_pipeline
+
+        result = await run_in_pipeline(
+            self.face_recognizer.register_person, person_id, image, landmarks_5
+        )
 
         if result["success"]:
             logger.info(
@@ -434,7 +441,7 @@ class AttendanceService:
             raise ValueError("Group not found")
 
         results = []
-        from hooks import process_face_detection
+        from hooks import process_face_detection, run_in_pipeline
 
         for idx, image_data in enumerate(images_data):
             try:
@@ -453,8 +460,8 @@ class AttendanceService:
                     )
                     continue
 
-                image = decode_base64_image(image_base64)
-                detections = process_face_detection(image)
+                image = await asyncio.to_thread(decode_base64_image, image_base64)
+                detections = await run_in_pipeline(process_face_detection, image)
 
                 if not detections:
                     results.append(
@@ -516,56 +523,81 @@ class AttendanceService:
         if not group:
             raise ValueError("Group not found")
 
-        success_count = 0
-        failed_count = 0
-        results = []
+        from hooks import run_in_pipeline
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(registrations)
+        pending = []
 
         for idx, reg_data in enumerate(registrations):
             try:
                 person_id = reg_data.get("person_id")
-                image_base64 = reg_data.get("image")
-
                 member = await self.repo.get_member(person_id)
                 if not member or member.group_id != group_id:
-                    failed_count += 1
-                    results.append(
-                        {"index": idx, "success": False, "error": "Invalid member"}
-                    )
+                    results[idx] = {
+                        "index": idx,
+                        "success": False,
+                        "error": "Invalid member",
+                    }
                     continue
+                pending.append((idx, person_id, reg_data))
+            except Exception as e:
+                results[idx] = {"index": idx, "success": False, "error": str(e)}
+
+        # Decode and register in bounded chunks so only a few full-size
+        # images are held at once; each chunk decodes concurrently and
+        # registers with a single pipeline call
+        for start in range(0, len(pending), BULK_REGISTER_CHUNK_SIZE):
+            chunk = pending[start : start + BULK_REGISTER_CHUNK_SIZE]
+            decoded = await asyncio.gather(
+                *(
+                    asyncio.to_thread(decode_base64_image, reg_data.get("image"))
+                    for _, _, reg_data in chunk
+                ),
+                return_exceptions=True,
+            )
 
-                try:
-                    image = decode_base64_image(image_base64)
-                except Exception:
-                    failed_count += 1
-                    results.append(
-                        {"index": idx, "success": False, "error": "Invalid image"}
-                    )
+            batch_indices = []
+            batch_entries = []
+            for (idx, person_id, reg_data), image in zip(chunk, decoded):
+                if isinstance(image, Exception):
+                    results[idx] = {
+                        "index": idx,
+                        "success": False,
+                        "error": "Invalid image",
+                    }
                     continue
+                batch_indices.append(idx)
+                batch_entries.append((person_id, image, reg_data.get("landmarks_5")))
 
-                landmarks_5 = reg_data.get("landmarks_5")
-                result = self.face_recognizer.register_person(
-                    person_id, image, landmarks_5
-                )
-
-                if result["success"]:
-                    success_count += 1
-                    results.append(
-                        {"index": idx, "person_id": person_id, "success": True}
+            if batch_entries:
+                try:
+                    batch_results = await run_in_pipeline(
+                        self.face_recognizer.register_persons_batch, batch_entries
                     )
-                else:
-                    failed_count += 1
-                    results.append(
-                        {
+                except Exception as e:
+                    batch_results = [{"success": False, "error": str(e)}] * len(
+                        batch_entries
+                    )
+
+                for idx, (person_id, _, _), result in zip(
+                    batch_indices, batch_entries, batch_results
+                ):
+                    if result["success"]:
+                        results[idx] = {
+                            "index": idx,
+                            "person_id": person_id,
+                            "success": True,
+                        }
+                    else:
+                        results[idx] = {
                             "index": idx,
                             "person_id": person_id,
                             "success": False,
                             "error": result.get("error"),
                         }
-                    )
 
-            except Exception as e:
-                failed_count += 1
-                results.append({"index": idx, "success": False, "error": str(e)})
+        success_count = sum(1 for result in results if result["success"])
+        failed_count = len(results) - success_count
 
         return {
             "success": True,
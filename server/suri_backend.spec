@@ -35,6 +35,25 @@ hidden_imports = [
     'numpy',
 ]
 
+# Accelerated event loop / HTTP parser selected in config/server.py
+hidden_imports.extend([
+    'uvicorn.protocols.http.httptools_impl',
+    'httptools',
+])
+if platform.system() != 'Windows':
+    hidden_imports.extend([
+        'uvicorn.loops.uvloop',
+        'uvloop',
+    ])
+
+# Optional accelerators imported inside try blocks (utils/); bundled so the
+# fast paths are used in frozen builds
+hidden_imports.extend([
+    'orjson',
+    'pybase64',
+    'turbojpeg',
+])
+
 # Windows-specific imports (only include on Windows)
 if platform.system() == 'Windows':
     hidden_imports.extend([
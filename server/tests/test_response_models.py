@@ -0,0 +1,149 @@
+import base64
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import core.lifespan
+from api.deps import get_repository
+from api.routes import detection, recognition
+
+LANDMARKS = [[30, 30], [70, 30], [50, 50], [35, 70], [65, 70]]
+
+
+def _image_base64() -> str:
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    return base64.b64encode(cv2.imencode(".png", image)[1]).decode()
+
+
+class StubRecognizer:
+    # Mirrors the numpy scalar types the real recognizer can hand back
+    def recognize_face(self, image, landmarks_5, allowed_person_ids=None):
+        return {
+            "success": True,
+            "person_id": "p1",
+            "similarity": np.float32(0.875),
+        }
+
+    def register_person(self, person_id, image, landmarks_5):
+        return {"success": True, "person_id": person_id, "total_persons": np.int64(3)}
+
+
+def _numpy_faces(*args, **kwargs):
+    return [
+        {
+            "bbox": {
+                "x": np.float32(10),
+                "y": np.float32(12),
+                "width": np.float32(40),
+                "height": np.float32(44),
+            },
+            "confidence": np.float32(0.9),
+            "landmarks_5": LANDMARKS,
+            "track_id": np.int64(-1),
+        }
+    ]
+
+
+class ResponseFieldTypeTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        app = FastAPI()
+        app.include_router(detection.router)
+        app.include_router(recognition.router)
+        app.dependency_overrides[get_repository] = lambda: None
+        cls.client = TestClient(app)
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(core.lifespan, "face_recognizer", StubRecognizer()),
+            mock.patch.object(
+                recognition,
+                "process_liveness_for_face_operation",
+                return_value=(False, None),
+            ),
+            mock.patch.object(detection, "process_frame", _numpy_faces),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_detect_response_types(self):
+        response = self.client.post("/detect", json={"image": _image_base64()})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+
+        self.assertIs(body["success"], True)
+        self.assertIsInstance(body["processing_time"], float)
+        self.assertIsInstance(body["model_used"], str)
+        self.assertIsInstance(body["suggested_skip"], int)
+
+        face = body["faces"][0]
+        self.assertEqual(len(face["bbox"]), 4)
+        for value in face["bbox"]:
+            self.assertIsInstance(value, float)
+        self.assertIsInstance(face["confidence"], float)
+        self.assertIsInstance(face["track_id"], int)
+
+    def test_recognize_response_types(self):
+        response = self.client.post(
+            "/face/recognize",
+            json={
+                "image": _image_base64(),
+                "bbox": [10, 12, 40, 44],
+                "landmarks_5": LANDMARKS,
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+
+        self.assertIs(body["success"], True)
+        self.assertEqual(body["person_id"], "p1")
+        self.assertIsInstance(body["similarity"], float)
+        self.assertAlmostEqual(body["similarity"], 0.875)
+        self.assertIsInstance(body["processing_time"], float)
+        self.assertIsNone(body["error"])
+
+    def test_recognize_error_is_string(self):
+        with mock.patch.object(
+            StubRecognizer, "recognize_face", side_effect=RuntimeError("boom")
+        ):
+            response = self.client.post(
+                "/face/recognize",
+                json={
+                    "image": _image_base64(),
+                    "bbox": [10, 12, 40, 44],
+                    "landmarks_5": LANDMARKS,
+                },
+            )
+        body = response.json()
+
+        self.assertIs(body["success"], False)
+        self.assertEqual(body["error"], "boom")
+        self.assertIsInstance(body["similarity"], float)
+
+    def test_register_response_types(self):
+        response = self.client.post(
+            "/face/register",
+            json={
+                "person_id": "p1",
+                "image": _image_base64(),
+                "bbox": [10, 12, 40, 44],
+                "landmarks_5": LANDMARKS,
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+
+        self.assertIs(body["success"], True)
+        self.assertEqual(body["person_id"], "p1")
+        self.assertIsInstance(body["total_persons"], int)
+        self.assertEqual(body["total_persons"], 3)
+        self.assertIsInstance(body["processing_time"], float)
+
+
+if __name__ == "__main__":
+    unittest.main()
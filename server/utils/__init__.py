@@ -6,6 +6,7 @@ Contains image processing utilities, WebSocket management, and face serializatio
 
 from .image_utils import (
     decode_base64_image,
+    decode_image_bytes,
     encode_image_to_base64,
     resize_image,
     normalize_image,
@@ -15,10 +16,11 @@ from .image_utils import (
     draw_detection_info,
 )
 from .websocket_manager import manager, ConnectionManager, handle_websocket_message
-from .face_utils import serialize_faces
+from .face_utils import serialize_faces, dumps_json
 
 __all__ = [
     "decode_base64_image",
+    "decode_image_bytes",
     "encode_image_to_base64",
     "resize_image",
     "normalize_image",
@@ -30,4 +32,5 @@ __all__ = [
     "ConnectionManager",
     "handle_websocket_message",
     "serialize_faces",
+    "dumps_json",
 ]
@@ -1,73 +1,133 @@
+import json
 import logging
+from collections import Counter
+from typing import Optional
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
 if not logging.getLogger().handlers:
     logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+BBOX_FIELDS = ("x", "y", "width", "height")
+_REQUIRED_BBOX_KEYS = frozenset(BBOX_FIELDS)
+
+_MISSING = object()
+
+
+# Cleaners fix up an optional field in place and return an issue label
+# when the field had to be dropped
+
+
+def _clean_track_id(face: dict, track_id) -> Optional[str]:
+    if isinstance(track_id, np.generic):
+        face["track_id"] = track_id.item()
+    return None
+
+
+def _clean_liveness(face: dict, liveness) -> Optional[str]:
+    # Validate liveness data and its required fields
+    if not isinstance(liveness, dict):
+        issue = "liveness not a dict"
+    elif "status" not in liveness:
+        issue = "liveness missing status"
+    elif "is_real" not in liveness:
+        issue = "liveness missing is_real"
+    else:
+        return None
+    del face["liveness"]
+    return issue
+
+
+def _drop_embedding(face: dict, _embedding) -> Optional[str]:
+    # Remove embedding to reduce payload size
+    del face["embedding"]
+    return None
+
+
+_FACE_CLEANERS = (
+    ("track_id", _clean_track_id),
+    ("liveness", _clean_liveness),
+    ("embedding", _drop_embedding),
+)
+
 
 def serialize_faces(faces: list, endpoint_name: str = "") -> list:
     """Serialize face detection results for API response"""
     serialized_faces = []
+    bbox_sources = []
+    issues = []
     for face in faces:
         # Validate required fields - no fallbacks
-        if "bbox" not in face or not isinstance(face["bbox"], dict):
-            logger.warning(f"Face missing bbox in {endpoint_name}: {face}")
+        bbox = face.get("bbox")
+        if not isinstance(bbox, dict):
+            issues.append("missing bbox")
             continue
 
         # Use bbox_original if present, otherwise use bbox
-        if "bbox_original" in face:
-            bbox_orig = face["bbox_original"]
-            if not isinstance(bbox_orig, dict):
-                logger.warning(f"Face bbox_original is not a dict: {face}")
-                continue
-        else:
-            bbox_orig = face["bbox"]
+        bbox_orig = face.get("bbox_original", bbox)
+        if not isinstance(bbox_orig, dict):
+            issues.append("bbox_original not a dict")
+            continue
 
         # Validate bbox has all required fields
-        required_bbox_fields = ["x", "y", "width", "height"]
-        if not all(field in bbox_orig for field in required_bbox_fields):
-            logger.warning(f"Face bbox missing required fields: {bbox_orig}")
+        if not _REQUIRED_BBOX_KEYS <= bbox_orig.keys():
+            issues.append("bbox missing required fields")
             continue
 
         # Validate confidence is present
-        if "confidence" not in face or face["confidence"] is None:
-            logger.warning(f"Face missing confidence: {face}")
+        if face.get("confidence") is None:
+            issues.append("missing confidence")
             continue
 
-        # Serialize bbox as array [x, y, width, height]
-        face["bbox"] = [
-            bbox_orig["x"],
-            bbox_orig["y"],
-            bbox_orig["width"],
-            bbox_orig["height"],
-        ]
-
-        # Convert track_id to int if present
-        if "track_id" in face and face["track_id"] is not None:
-            track_id_value = face["track_id"]
-            if isinstance(track_id_value, (np.integer, np.int32, np.int64)):
-                face["track_id"] = int(track_id_value)
-
-        # Validate liveness data if present
-        if "liveness" in face:
-            liveness = face["liveness"]
-            if not isinstance(liveness, dict):
-                logger.warning(f"Face liveness is not a dict: {face}")
-                del face["liveness"]
-            else:
-                # Validate required liveness fields
-                if "status" not in liveness:
-                    logger.warning(f"Face liveness missing status: {liveness}")
-                    del face["liveness"]
-                elif "is_real" not in liveness:
-                    logger.warning(f"Face liveness missing is_real: {liveness}")
-                    del face["liveness"]
-
-        # Remove embedding to reduce payload size
-        if "embedding" in face:
-            del face["embedding"]
+        # Convert NumPy scalars to native types so encoders take the fast path
+        if isinstance(face["confidence"], np.generic):
+            face["confidence"] = face["confidence"].item()
+
+        # Clean optional fields that are present
+        for key, cleaner in _FACE_CLEANERS:
+            value = face.get(key, _MISSING)
+            if value is not _MISSING:
+                issue = cleaner(face, value)
+                if issue:
+                    issues.append(issue)
 
         serialized_faces.append(face)
+        bbox_sources.append(bbox_orig)
+
+    # One aggregated record per call instead of one per malformed face
+    if issues:
+        logger.warning(
+            "Dropped invalid face data in %s: %s",
+            endpoint_name or "serialize_faces",
+            dict(Counter(issues)),
+        )
+
+    if not serialized_faces:
+        return serialized_faces
+
+    # Serialize every bbox as [x, y, width, height] in one gather
+    bbox_lists = (
+        np.fromiter(
+            (bbox[key] for bbox in bbox_sources for key in BBOX_FIELDS),
+            dtype=np.float64,
+            count=4 * len(bbox_sources),
+        )
+        .reshape(-1, 4)
+        .tolist()
+    )
+    for face, bbox_list in zip(serialized_faces, bbox_lists):
+        face["bbox"] = bbox_list
 
     return serialized_faces
+
+
+def dumps_json(payload) -> str:
+    """Encode a response payload to JSON text, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
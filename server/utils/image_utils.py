@@ -2,12 +2,55 @@
 Image utility functions for the face detection API
 """
 
-import base64
-from typing import Tuple
+from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 
+try:
+    # SIMD base64 codec with the stdlib API; optional
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    # libjpeg-turbo bindings; optional, and needs the native library too
+    from turbojpeg import TurboJPEG, TJPF_BGR
+
+    _turbojpeg = TurboJPEG()
+except Exception:
+    _turbojpeg = None
+
+_JPEG_MAGIC = b"\xff\xd8"
+_EXIF_HEADER = b"Exif\x00\x00"
+
+
+def decode_image_bytes(image_data: bytes) -> Optional[np.ndarray]:
+    """
+    Decode encoded image bytes to an OpenCV image
+
+    JPEGs go through libjpeg-turbo when available. Everything else falls back
+    to cv2.imdecode, including JPEGs with EXIF data (OpenCV applies their
+    orientation tag, turbojpeg does not) and any JPEG turbojpeg rejects.
+
+    Args:
+        image_data: Encoded image bytes (JPEG, PNG, ...)
+
+    Returns:
+        OpenCV image as numpy array (BGR format), or None if decoding failed
+    """
+    if (
+        _turbojpeg is not None
+        and image_data[:2] == _JPEG_MAGIC
+        and _EXIF_HEADER not in image_data[:65536]
+    ):
+        try:
+            return _turbojpeg.decode(image_data, pixel_format=TJPF_BGR)
+        except Exception:
+            pass
+
+    return cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+
 
 def decode_base64_image(base64_string: str) -> np.ndarray:
     """
@@ -22,16 +65,13 @@ def decode_base64_image(base64_string: str) -> np.ndarray:
     try:
         # Remove data URL prefix if present
         if base64_string.startswith("data:image"):
-            base64_string = base64_string.split(",")[1]
+            base64_string = base64_string.partition(",")[2]
 
         # Decode base64
         image_data = base64.b64decode(base64_string)
 
-        # Convert to numpy array
-        nparr = np.frombuffer(image_data, np.uint8)
-
         # Decode image
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        image = decode_image_bytes(image_data)
 
         if image is None:
             raise ValueError("Failed to decode image")